@@ -9,6 +9,7 @@ from loguru import logger
 from src.main import run_scanner as run_main_scanner
 from src_core.main import run_scanner as run_core_scanner
 from src_anomaly.main import run_scanner as run_anomaly_scanner
+from src.utils.eventloop import run_event_loop
 
 
 async def run_all() -> None:
@@ -27,7 +28,7 @@ async def run_all() -> None:
 def main() -> None:
     """Entry point."""
     try:
-        asyncio.run(run_all())
+        run_event_loop(run_all())
     except KeyboardInterrupt:
         logger.info("Shutting down all detectors...")
 
@@ -6,8 +6,8 @@ from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
-class Settings(BaseSettings):
-    """Application settings loaded from environment variables."""
+class DetectorSettings(BaseSettings):
+    """Settings shared by all detectors (main, core and anomaly)."""
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -18,6 +18,27 @@ class Settings(BaseSettings):
 
     # Telegram configuration
     telegram_bot_token: str = Field(..., description="Telegram bot token")
+
+    # Scan settings
+    scan_interval_seconds: int = Field(
+        default=60,
+        description="Interval between scans in seconds",
+    )
+
+    # MEXC API settings
+    mexc_futures_base_url: str = Field(
+        default="https://contract.mexc.com",
+        description="MEXC Futures API base URL",
+    )
+
+    # Logging
+    log_level: str = Field(default="INFO", description="Logging level")
+
+
+class Settings(DetectorSettings):
+    """Application settings loaded from environment variables."""
+
+    # Telegram configuration
     telegram_chat_id: str = Field(..., description="Telegram chat/channel ID")
 
     # Pump detection settings
@@ -25,10 +46,6 @@ class Settings(BaseSettings):
         default=7.0,
         description="Minimum price increase percentage to trigger alert",
     )
-    scan_interval_seconds: int = Field(
-        default=60,
-        description="Interval between scans in seconds",
-    )
     candle_interval: str = Field(
         default="Min1",
         description="Candle interval for analysis (Min1, Min5, Min15, etc.)",
@@ -38,12 +55,6 @@ class Settings(BaseSettings):
         description="Number of recent candles to analyze for pump detection",
     )
 
-    # MEXC API settings
-    mexc_futures_base_url: str = Field(
-        default="https://contract.mexc.com",
-        description="MEXC Futures API base URL",
-    )
-
     # Pump tracking settings
     min_volume_usd: int = Field(
         default=1_000_000,
@@ -58,9 +69,6 @@ class Settings(BaseSettings):
         description="Minimum previous pumps to show coin history in signals",
     )
 
-    # Logging
-    log_level: str = Field(default="INFO", description="Logging level")
-
 
 @lru_cache
 def get_settings() -> Settings:
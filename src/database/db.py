@@ -7,6 +7,16 @@ from loguru import logger
 
 from src.database.models import PumpRecord, PumpStatus, CoinStats, GlobalStats
 
+# Applied to every connection. WAL appends commits to a log instead of
+# rewriting pages behind a rollback journal, and synchronous=NORMAL then
+# fsyncs at checkpoints rather than on every commit: a power loss can drop
+# the last few commits but never corrupts the database
+SQLITE_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+"""
+
 
 class Database:
     """Async SQLite database for pump tracking."""
@@ -20,11 +30,16 @@ class Database:
         self._db_path = Path(db_path)
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
         self._conn: aiosqlite.Connection | None = None
+        # Per-coin stats only depend on completed pumps, so they are cached
+        # per symbol and dropped when one of that coin's pumps completes
+        self._coin_stats: dict[str, CoinStats | None] = {}
+        self._last_results: dict[tuple[str, int], list[bool]] = {}
     
     async def connect(self) -> None:
         """Connect to database and create tables."""
         self._conn = await aiosqlite.connect(self._db_path)
         self._conn.row_factory = aiosqlite.Row
+        await self._conn.executescript(SQLITE_PRAGMAS)
         await self._create_tables()
         logger.info(f"Connected to database: {self._db_path}")
     
@@ -64,8 +79,12 @@ class Database:
                 completed_at TIMESTAMP
             );
             
-            CREATE INDEX IF NOT EXISTS idx_pump_symbol ON pump_records(symbol);
-            CREATE INDEX IF NOT EXISTS idx_pump_status ON pump_records(status);
+            -- Composite indexes return per-coin and per-status rows already
+            -- ordered by detected_at, so no temp B-tree sort is needed
+            DROP INDEX IF EXISTS idx_pump_symbol;
+            DROP INDEX IF EXISTS idx_pump_status;
+            CREATE INDEX IF NOT EXISTS idx_pump_symbol_detected ON pump_records(symbol, detected_at);
+            CREATE INDEX IF NOT EXISTS idx_pump_status_detected ON pump_records(status, detected_at);
             CREATE INDEX IF NOT EXISTS idx_pump_detected ON pump_records(detected_at);
             
             CREATE TABLE IF NOT EXISTS pinned_messages (
@@ -106,11 +125,18 @@ class Database:
             record.monitoring_ends_at.isoformat() if record.monitoring_ends_at else None,
         ))
         await self._conn.commit()
+        self._invalidate_coin_stats([record])
         return cursor.lastrowid
     
-    async def update_pump(self, record: PumpRecord) -> None:
-        """Update an existing pump record."""
-        await self._conn.execute("""
+    async def update_pumps(self, records: list[PumpRecord]) -> None:
+        """Update several pump records in a single transaction.
+        
+        Args:
+            records: Records to update (e.g., all pumps checked in a cycle).
+        """
+        if not records:
+            return
+        await self._conn.executemany("""
             UPDATE pump_records SET
                 highest_price = ?,
                 lowest_price = ?,
@@ -125,22 +151,45 @@ class Database:
                 status = ?,
                 completed_at = ?
             WHERE id = ?
-        """, (
-            record.highest_price,
-            record.lowest_price,
-            record.last_checked_price,
-            record.last_checked_at.isoformat() if record.last_checked_at else None,
-            record.time_to_25pct_retrace,
-            record.time_to_50pct_retrace,
-            record.time_to_75pct_retrace,
-            record.time_to_100pct_retrace,
-            record.max_drop_from_high_pct,
-            1 if record.returned_to_prepump else 0,
-            record.status.value,
-            record.completed_at.isoformat() if record.completed_at else None,
-            record.id,
-        ))
+        """, [
+            (
+                record.highest_price,
+                record.lowest_price,
+                record.last_checked_price,
+                record.last_checked_at.isoformat() if record.last_checked_at else None,
+                record.time_to_25pct_retrace,
+                record.time_to_50pct_retrace,
+                record.time_to_75pct_retrace,
+                record.time_to_100pct_retrace,
+                record.max_drop_from_high_pct,
+                1 if record.returned_to_prepump else 0,
+                record.status.value,
+                record.completed_at.isoformat() if record.completed_at else None,
+                record.id,
+            )
+            for record in records
+        ])
         await self._conn.commit()
+        self._invalidate_coin_stats(records)
+
+    def _invalidate_coin_stats(self, records: list[PumpRecord]) -> None:
+        """Drop cached per-coin stats for coins with newly completed pumps.
+
+        Args:
+            records: Records just written; only non-monitoring ones matter.
+        """
+        symbols = {
+            record.symbol for record in records
+            if record.status != PumpStatus.MONITORING
+        }
+        if not symbols:
+            return
+        for symbol in symbols:
+            self._coin_stats.pop(symbol, None)
+        self._last_results = {
+            key: results for key, results in self._last_results.items()
+            if key[0] not in symbols
+        }
     
     async def get_active_pumps(self) -> list[PumpRecord]:
         """Get all pumps currently being monitored."""
@@ -189,34 +238,50 @@ class Database:
         rows = await cursor.fetchall()
         return [self._row_to_pump_record(row) for row in rows]
     
+    # Status members by stored value: a dict hit instead of an Enum call
+    _STATUSES = {status.value: status for status in PumpStatus}
+
     def _row_to_pump_record(self, row: aiosqlite.Row) -> PumpRecord:
         """Convert database row to PumpRecord."""
+        fromiso = datetime.fromisoformat
+        # Optional timestamps are read from the row once each
+        last_checked_at = row["last_checked_at"]
+        monitoring_ends_at = row["monitoring_ends_at"]
+        completed_at = row["completed_at"]
         return PumpRecord(
             id=row["id"],
             symbol=row["symbol"],
-            detected_at=datetime.fromisoformat(row["detected_at"]),
+            detected_at=fromiso(row["detected_at"]),
             pump_percent=row["pump_percent"],
             price_at_detection=row["price_at_detection"],
             price_before_pump=row["price_before_pump"],
             highest_price=row["highest_price"] or 0,
             lowest_price=row["lowest_price"] or 0,
             last_checked_price=row["last_checked_price"] or 0,
-            last_checked_at=datetime.fromisoformat(row["last_checked_at"]) if row["last_checked_at"] else None,
+            last_checked_at=fromiso(last_checked_at) if last_checked_at else None,
             time_to_25pct_retrace=row["time_to_25pct_retrace"],
             time_to_50pct_retrace=row["time_to_50pct_retrace"],
             time_to_75pct_retrace=row["time_to_75pct_retrace"],
             time_to_100pct_retrace=row["time_to_100pct_retrace"],
             max_drop_from_high_pct=row["max_drop_from_high_pct"] or 0,
             returned_to_prepump=bool(row["returned_to_prepump"]),
-            status=PumpStatus(row["status"]),
-            monitoring_ends_at=datetime.fromisoformat(row["monitoring_ends_at"]) if row["monitoring_ends_at"] else None,
-            completed_at=datetime.fromisoformat(row["completed_at"]) if row["completed_at"] else None,
+            status=self._STATUSES[row["status"]],
+            monitoring_ends_at=fromiso(monitoring_ends_at) if monitoring_ends_at else None,
+            completed_at=fromiso(completed_at) if completed_at else None,
         )
     
     # ==================== Statistics ====================
     
     async def get_coin_stats(self, symbol: str) -> CoinStats | None:
         """Calculate statistics for a specific coin."""
+        if symbol in self._coin_stats:
+            return self._coin_stats[symbol]
+        stats = await self._query_coin_stats(symbol)
+        self._coin_stats[symbol] = stats
+        return stats
+
+    async def _query_coin_stats(self, symbol: str) -> CoinStats | None:
+        """Aggregate completed pumps for a specific coin."""
         cursor = await self._conn.execute("""
             SELECT 
                 COUNT(*) as total,
@@ -277,7 +342,8 @@ class Database:
         """, (today_start.isoformat(),))
         today = await cursor.fetchone()
         
-        # Top performers (min 2 completed pumps, sorted by FULL REVERSAL rate)
+        # Per-coin FULL REVERSAL rates (min 2 completed pumps), aggregated
+        # once for both the top and worst performers
         cursor = await self._conn.execute("""
             SELECT 
                 symbol,
@@ -289,27 +355,14 @@ class Database:
             GROUP BY symbol
             HAVING total >= 2
             ORDER BY rate DESC, total DESC
-            LIMIT 5
         """)
-        top_rows = await cursor.fetchall()
-        top_coins = [(row["symbol"], row["rate"], row["total"]) for row in top_rows]
+        coin_rates = [(row["symbol"], row["rate"], row["total"]) for row in await cursor.fetchall()]
         
-        # Worst performers (min 2 completed pumps, sorted by FULL REVERSAL rate)
-        cursor = await self._conn.execute("""
-            SELECT 
-                symbol,
-                COUNT(*) as total,
-                SUM(CASE WHEN returned_to_prepump = 1 THEN 1 ELSE 0 END) as full_reversals,
-                CAST(SUM(CASE WHEN returned_to_prepump = 1 THEN 1 ELSE 0 END) AS FLOAT) / COUNT(*) * 100 as rate
-            FROM pump_records
-            WHERE status != 'monitoring'
-            GROUP BY symbol
-            HAVING total >= 2
-            ORDER BY rate ASC, total DESC
-            LIMIT 3
-        """)
-        worst_rows = await cursor.fetchall()
-        worst_coins = [(row["symbol"], row["rate"], row["total"]) for row in worst_rows]
+        # Top performers: highest rate first, ties by most pumps
+        top_coins = coin_rates[:5]
+        
+        # Worst performers: lowest rate first, ties by most pumps
+        worst_coins = sorted(coin_rates, key=lambda coin: (coin[1], -coin[2]))[:3]
         
         return GlobalStats(
             total_pumps=overall["total"] or 0,
@@ -327,6 +380,9 @@ class Database:
     
     async def get_last_n_results(self, symbol: str, n: int = 5) -> list[bool]:
         """Get last N pump results for a coin (True = hit 50%, False = didn't)."""
+        cached = self._last_results.get((symbol, n))
+        if cached is not None:
+            return list(cached)
         cursor = await self._conn.execute("""
             SELECT time_to_50pct_retrace IS NOT NULL as success
             FROM pump_records
@@ -335,7 +391,9 @@ class Database:
             LIMIT ?
         """, (symbol, n))
         rows = await cursor.fetchall()
-        return [bool(row["success"]) for row in rows]
+        results = [bool(row["success"]) for row in rows]
+        self._last_results[(symbol, n)] = results
+        return list(results)
     
     # ==================== Pinned Messages ====================
     
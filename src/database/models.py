@@ -13,7 +13,52 @@ class PumpStatus(Enum):
     FAILED = "failed"    # No significant retrace
 
 
-@dataclass
+# (unit size in seconds, format spec, suffix), largest first; anything
+# shorter than the last unit is still shown in that unit
+DURATION_UNITS = ((3600, ".1f", "h"), (60, ".0f", "m"))
+
+
+def format_duration(seconds: float | None) -> str:
+    """Format a duration as hours (or minutes when under an hour).
+
+    Args:
+        seconds: Duration in seconds, or None if unknown.
+
+    Returns:
+        Formatted duration, e.g. "2.5h" or "40m", or "N/A".
+    """
+    if seconds is None:
+        return "N/A"
+
+    for size, spec, suffix in DURATION_UNITS:
+        if seconds >= size:
+            break
+    return f"{seconds / size:{spec}}{suffix}"
+
+
+# UTC+3 offset in seconds (alert and stats times are shown in UTC+3)
+UTC_PLUS_3_OFFSET = 3 * 3600
+
+
+def format_utc3_clock(timestamp: float, with_seconds: bool = True) -> str:
+    """Format a Unix timestamp as UTC+3 clock time.
+
+    Works on epoch seconds directly, without a timezone conversion or
+    strftime.
+
+    Args:
+        timestamp: Unix timestamp in seconds.
+        with_seconds: Whether to include seconds.
+
+    Returns:
+        Clock time, e.g. "14:05:09", or "14:05" without seconds.
+    """
+    ts = int(timestamp) + UTC_PLUS_3_OFFSET
+    clock = f"{ts // 3600 % 24:02d}:{ts // 60 % 60:02d}"
+    return f"{clock}:{ts % 60:02d}" if with_seconds else clock
+
+
+@dataclass(slots=True)
 class PumpRecord:
     """Record of a detected pump and its outcome."""
     
@@ -74,7 +119,7 @@ class PumpRecord:
         return ((self.highest_price - current_price) / self.highest_price) * 100
 
 
-@dataclass
+@dataclass(slots=True)
 class CoinStats:
     """Aggregated statistics for a coin."""
     
@@ -126,29 +171,15 @@ class CoinStats:
     @property
     def avg_time_to_50pct_formatted(self) -> str:
         """Format average time to 50% retrace."""
-        if self.avg_time_to_50pct_seconds is None:
-            return "N/A"
-        
-        hours = self.avg_time_to_50pct_seconds / 3600
-        if hours < 1:
-            minutes = self.avg_time_to_50pct_seconds / 60
-            return f"{minutes:.0f}m"
-        return f"{hours:.1f}h"
+        return format_duration(self.avg_time_to_50pct_seconds)
     
     @property
     def avg_time_to_100pct_formatted(self) -> str:
         """Format average time to full reversal."""
-        if self.avg_time_to_100pct_seconds is None:
-            return "N/A"
-        
-        hours = self.avg_time_to_100pct_seconds / 3600
-        if hours < 1:
-            minutes = self.avg_time_to_100pct_seconds / 60
-            return f"{minutes:.0f}m"
-        return f"{hours:.1f}h"
+        return format_duration(self.avg_time_to_100pct_seconds)
 
 
-@dataclass 
+@dataclass(slots=True)
 class GlobalStats:
     """Global statistics across all coins."""
     
@@ -1,15 +1,12 @@
 """Signal data models."""
 
 from dataclasses import dataclass, field
-from datetime import datetime, timezone, timedelta
+from datetime import datetime
 
+from src.database.models import format_utc3_clock
 from src.utils.indicators import Trend, get_trend_emoji, get_rsi_emoji
 
 
-# UTC+3 timezone
-UTC_PLUS_3 = timezone(timedelta(hours=3))
-
-
 @dataclass
 class ExchangeLinks:
     """Links to the coin on various exchanges."""
@@ -50,7 +47,7 @@ class PumpSignal:
 
     # Trend analysis (1D and 1W only)
     trend_1d: Trend = Trend.NEUTRAL
-    trend_1w: Trend | None = None  # None if not enough data (needs 4+ weeks)
+    trend_1w: Trend | None = None  # None if not enough data (needs TREND_PERIOD weeks)
 
     # BTC trend (market context)
     btc_trend_1d: Trend | None = None
@@ -83,7 +80,7 @@ class PumpSignal:
     @property
     def coin_name(self) -> str:
         """Get clean coin name without _USDT suffix."""
-        return self.symbol.replace("_USDT", "")
+        return self.symbol.removesuffix("_USDT")
 
     def _get_funding_emoji(self) -> str:
         """Get emoji based on funding rate level."""
@@ -100,101 +97,72 @@ class PumpSignal:
 
     def format_message(self) -> str:
         """Format signal as a Telegram message."""
-        # Convert to UTC+3
-        local_time = self.detected_at.astimezone(UTC_PLUS_3)
+        time_text = format_utc3_clock(self.detected_at.timestamp())
 
+        # Fixed-shape blocks are single multi-line f-strings, so only the
+        # optional lines need their own list entries
         lines = [
-            f"🚀 <b>{self.symbol}</b> 🚀",
-            "",
-            f"<b>Change:</b> +{self.price_change_percent:.2f}%",
-            f"<b>Price:</b> ${self.current_price:.6f}",
-            f"<b>Volume 24h:</b> ${self.volume_24h:,.0f}",
+            f"🚀 <b>{self.symbol}</b> 🚀\n"
+            "\n"
+            f"<b>Change:</b> +{self.price_change_percent:.2f}%\n"
+            f"<b>Price:</b> ${self.current_price:.6f}\n"
+            f"<b>Volume 24h:</b> ${self.volume_24h:,.0f}\n"
+            "\n"
+            "<b>━━━ Technical Analysis ━━━</b>",
         ]
 
-        # Technical analysis section
-        lines.extend(
-            [
-                "",
-                "<b>━━━ Technical Analysis ━━━</b>",
-            ]
-        )
-
         if self.has_technical_data:
             # RSI formatting (1M and 1H only)
             rsi_1m_text = f"{self.rsi_1m:.0f}" if self.rsi_1m is not None else "N/A"
             rsi_1h_text = f"{self.rsi_1h:.0f}" if self.rsi_1h is not None else "N/A"
-            rsi_1m_emoji = get_rsi_emoji(self.rsi_1m)
-            rsi_1h_emoji = get_rsi_emoji(self.rsi_1h)
-
-            # Trend formatting (1D and 1W only)
-            trend_1d_emoji = get_trend_emoji(self.trend_1d)
 
-            # Build trend line (include 1W only if data available)
-            trend_parts = [f"{trend_1d_emoji} 1D"]
+            # Trend line (include 1W only if data available)
+            trend_text = f"{get_trend_emoji(self.trend_1d)} 1D"
             if self.trend_1w is not None:
-                trend_1w_emoji = get_trend_emoji(self.trend_1w)
-                trend_parts.append(f"{trend_1w_emoji} 1W")
+                trend_text += f" | {get_trend_emoji(self.trend_1w)} 1W"
+
+            lines.append(
+                "\n"
+                f"<b>RSI:</b> {get_rsi_emoji(self.rsi_1m)} 1M: {rsi_1m_text} | "
+                f"{get_rsi_emoji(self.rsi_1h)} 1H: {rsi_1h_text}\n"
+                f"<b>Trend:</b> {trend_text}"
+            )
 
-            # BTC trend line
+            # BTC trend line (add if available)
             btc_trend_parts = []
             if self.btc_trend_1d is not None:
-                btc_1d_emoji = get_trend_emoji(self.btc_trend_1d)
-                btc_trend_parts.append(f"{btc_1d_emoji} 1D")
+                btc_trend_parts.append(f"{get_trend_emoji(self.btc_trend_1d)} 1D")
             if self.btc_trend_1w is not None:
-                btc_1w_emoji = get_trend_emoji(self.btc_trend_1w)
-                btc_trend_parts.append(f"{btc_1w_emoji} 1W")
-
-            lines.extend(
-                [
-                    "",
-                    f"<b>RSI:</b> {rsi_1m_emoji} 1M: {rsi_1m_text} | {rsi_1h_emoji} 1H: {rsi_1h_text}",
-                    f"<b>Trend:</b> {' | '.join(trend_parts)}",
-                ]
-            )
-
-            # Add BTC trend if available
+                btc_trend_parts.append(f"{get_trend_emoji(self.btc_trend_1w)} 1W")
             if btc_trend_parts:
                 lines.append(f"<b>BTC:</b> {' | '.join(btc_trend_parts)}")
 
             # Funding rate formatting
             if self.funding_rate is not None:
-                funding_emoji = self._get_funding_emoji()
                 lines.append(
-                    f"<b>Funding:</b> {self.funding_rate:+.4f}% {funding_emoji}"
+                    f"<b>Funding:</b> {self.funding_rate:+.4f}% {self._get_funding_emoji()}"
                 )
 
             # ATH formatting
             if self.ath_price:
-                ath_emoji = "❌" if self.is_ath else "✅"
                 if self.is_ath:
-                    ath_text = f"ATH: {ath_emoji} ${self.ath_price:.6f}"
+                    lines.append(f"<b>ATH: ❌ ${self.ath_price:.6f}</b>")
                 else:
                     ath_diff = (
                         (self.ath_price - self.current_price) / self.current_price
                     ) * 100
-                    ath_text = f"ATH: {ath_emoji} ${self.ath_price:.6f} ({ath_diff:.1f}% below)"
-                lines.append(f"<b>{ath_text}</b>")
+                    lines.append(
+                        f"<b>ATH: ✅ ${self.ath_price:.6f} ({ath_diff:.1f}% below)</b>"
+                    )
         else:
             # Technical analysis unavailable
-            lines.extend(
-                [
-                    "",
-                    "<i>⚠️ Analysis unavailable for MEXC-only pairs</i>",
-                ]
-            )
+            lines.append("\n<i>⚠️ Analysis unavailable for MEXC-only pairs</i>")
 
         # Reversal history section (show if at least 1 previous pump)
         if self.reversal_history and self.reversal_history.total_pumps >= 1:
-            lines.append("")
-            lines.append(self._format_reversal_history())
-
-        lines.extend(
-            [
-                "",
-                f"<b>Time:</b> {local_time.strftime('%H:%M:%S')} (UTC+3)",
-                "",
-            ]
-        )
+            lines.append("\n" + self._format_reversal_history())
+
+        lines.append(f"\n<b>Time:</b> {time_text} (UTC+3)\n")
 
         # Exchange links
         exchange_links = self._format_exchange_links()
@@ -1,14 +1,32 @@
 """Services for the pump detector."""
 
-from src.services.mexc import MEXCClient
-from src.services.binance import BinanceClient
-from src.services.bybit import ByBitClient
-from src.services.bingx import BingXClient
-from src.services.chart import ChartGenerator
-from src.services.detector import PumpDetector
-from src.services.telegram import TelegramNotifier
-from src.services.tracker import PumpTracker
-from src.services.stats import StatsFormatter
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.services.mexc import MEXCClient
+    from src.services.binance import BinanceClient
+    from src.services.bybit import ByBitClient
+    from src.services.bingx import BingXClient
+    from src.services.chart import ChartGenerator
+    from src.services.detector import PumpDetector
+    from src.services.telegram import TelegramNotifier
+    from src.services.tracker import PumpTracker
+    from src.services.stats import StatsFormatter
+
+# Exports are imported on first access, so importing one service (e.g. the
+# core detector's clients) doesn't pay for aiogram and the rest at startup
+_EXPORTS = {
+    "MEXCClient": "src.services.mexc",
+    "BinanceClient": "src.services.binance",
+    "ByBitClient": "src.services.bybit",
+    "BingXClient": "src.services.bingx",
+    "ChartGenerator": "src.services.chart",
+    "PumpDetector": "src.services.detector",
+    "TelegramNotifier": "src.services.telegram",
+    "PumpTracker": "src.services.tracker",
+    "StatsFormatter": "src.services.stats",
+}
 
 __all__ = [
     "MEXCClient",
@@ -21,3 +39,13 @@ __all__ = [
     "PumpTracker",
     "StatsFormatter",
 ]
+
+
+def __getattr__(name: str):
+    """Import an exported service class on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
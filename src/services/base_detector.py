@@ -0,0 +1,471 @@
+"""Shared exchange data and technical analysis helpers for the detectors."""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Any
+
+from loguru import logger
+
+from src.models.signal import ExchangeLinks, PumpSignal, ReversalHistory
+from src.services.mexc import MEXCClient
+from src.services.binance import BinanceClient
+from src.services.bybit import ByBitClient
+from src.services.bingx import BingXClient
+from src.services.chart import ChartGenerator
+from src.services.tracker import PumpTracker
+from src.utils.indicators import TREND_PERIOD, calculate_rsi, determine_trend, Trend
+
+
+class BaseDetector:
+    """Base class for the main, core and anomaly pump detectors.
+
+    Holds the exchange clients and the alert/BTC trend state, and implements
+    the candidate analysis and indicator helpers every detector shares. Kline
+    values are floats already (the exchange clients parse them once), so
+    helpers read them directly instead of re-converting each candle.
+    Subclasses set ``self._settings`` before calling ``__init__``.
+    """
+
+    # Number of 1H candles needed for chart
+    # We fetch extra for indicator warmup (40) + display (60) = 100 visible after trim
+    CHART_CANDLES = 140
+
+    # Prefix for log lines, to tell detectors apart when running all three
+    LOG_PREFIX = ""
+
+    # Max pump candidates analyzed at once (each fans out to several requests)
+    MAX_CONCURRENT_ANALYSES = 8
+
+    def __init__(
+        self,
+        mexc_client: MEXCClient,
+        binance_client: BinanceClient,
+        bybit_client: ByBitClient,
+        bingx_client: BingXClient,
+        tracker: PumpTracker | None = None,
+    ) -> None:
+        """Initialize shared detector state.
+
+        Args:
+            mexc_client: MEXC API client.
+            binance_client: Binance API client.
+            bybit_client: ByBit API client.
+            bingx_client: BingX API client.
+            tracker: Pump tracker for recording and monitoring pumps.
+        """
+        self._mexc = mexc_client
+        self._binance = binance_client
+        self._bybit = bybit_client
+        self._bingx = bingx_client
+        self._tracker = tracker
+        self._chart_generator = ChartGenerator()
+        self._chart_generator.warm_up()
+        self._alerted_symbols: set[str] = set()
+
+        # Cached BTC trend (refreshed every scan cycle)
+        self._btc_trend_1d: Trend | None = None
+        self._btc_trend_1w: Trend | None = None
+
+    async def load_alerted_symbols(self) -> None:
+        """Load currently monitored symbols from database to prevent duplicates on restart."""
+        if not self._tracker:
+            return
+
+        # Only load symbols that are CURRENTLY being monitored (not completed ones)
+        # This allows coins to pump again after their monitoring period ends
+        active_pumps = await self._tracker._db.get_active_pumps()
+        self._alerted_symbols = {p.symbol for p in active_pumps}
+
+        logger.info(f"{self.LOG_PREFIX} Loaded {len(self._alerted_symbols)} currently monitored symbols")
+
+    def clear_alerts(self) -> None:
+        """Clear the alerted symbols cache."""
+        self._alerted_symbols.clear()
+
+    def remove_completed_alerts(self, symbols: list[str]) -> None:
+        """Remove completed symbols from alerted cache so they can pump again.
+
+        Args:
+            symbols: List of symbols to remove.
+        """
+        for symbol in symbols:
+            self._alerted_symbols.discard(symbol)
+
+    def _find_pumps(
+        self,
+        tickers: list[dict],
+        threshold_percent: float,
+        min_volume: float,
+    ) -> list[dict]:
+        """Select tickers that meet the pump threshold and volume requirements.
+
+        Filters the whole batch in one loop with the thresholds bound to
+        locals, rather than a method call per ticker. Symbols that were
+        already alerted are skipped.
+
+        Args:
+            tickers: MEXC ticker data.
+            threshold_percent: Minimum 24h price change in percent.
+            min_volume: Minimum 24h volume in USD.
+
+        Returns:
+            Tickers that qualify as pump candidates, in input order.
+        """
+        alerted = self._alerted_symbols
+        pumps = []
+
+        for ticker in tickers:
+            try:
+                # Set lookup first: alerted symbols skip both float() parses
+                if (
+                    ticker.get("symbol", "") not in alerted
+                    and float(ticker["riseFallRate"]) * 100 >= threshold_percent
+                    and float(ticker.get("volume24", 0)) >= min_volume
+                ):
+                    pumps.append(ticker)
+            except (KeyError, ValueError, TypeError):
+                continue
+
+        return pumps
+
+    async def _analyze_pumps(self, tickers: list[dict]) -> list[PumpSignal]:
+        """Analyze pump candidates concurrently.
+
+        Args:
+            tickers: MEXC tickers that passed the first-pass filter.
+
+        Returns:
+            Signals for the candidates that could be analyzed, in input order.
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_ANALYSES)
+
+        async def analyze(ticker: dict) -> PumpSignal | None:
+            async with semaphore:
+                return await self._analyze_pump(ticker)
+
+        results = await asyncio.gather(*(analyze(ticker) for ticker in tickers))
+        return [signal for signal in results if signal]
+
+    async def _analyze_pump(self, ticker: dict) -> PumpSignal | None:
+        """Perform detailed technical analysis on a pump candidate.
+
+        Tries exchanges in order: Binance -> ByBit -> BingX
+        """
+        try:
+            symbol = ticker.get("symbol", "")
+
+            # Basic data from MEXC ticker
+            price_change_percent = float(ticker.get("riseFallRate", 0)) * 100
+            volume_24h = float(ticker.get("volume24", 0))
+            current_price = float(ticker.get("lastPrice", 0))
+
+            # Build exchange links
+            links = self._build_exchange_links(symbol)
+
+            # Technical analysis data (default empty)
+            rsi_1m = None
+            rsi_1h = None
+            trend_1d = Trend.NEUTRAL
+            trend_1w = None
+            funding_rate = None
+            is_ath = False
+            ath_price = None
+            data_source = None
+            chart_image = None
+
+            # Fetch technical data from exchanges (in priority order) and the
+            # coin's reversal history from the database at the same time
+            # (no history without a tracker, e.g. for the core detector).
+            # Funding comes from the exchange serving the klines, which is
+            # almost always the first listing one, so request it alongside
+            preferred_source = self._preferred_data_source(symbol)
+            klines_result, reversal_history, preferred_funding = await asyncio.gather(
+                self._fetch_klines_from_any_exchange(symbol),
+                self._get_reversal_history(symbol),
+                self._fetch_funding_rate(symbol, preferred_source),
+            )
+
+            if klines_result:
+                data_source, klines = klines_result
+
+                # Bind each timeframe once; several helpers share them
+                klines_1h = klines.get("1h", [])
+                klines_1d = klines.get("1d", [])
+                klines_1w = klines.get("1w", [])
+
+                rsi_1m = self._calculate_rsi_from_klines(klines.get("1m", []))
+                rsi_1h = self._calculate_rsi_from_klines(klines_1h)
+                trend_1d = self._determine_trend_from_klines(klines_1d)
+
+                # 1W trend - only once the coin has TREND_PERIOD weeks of
+                # history; younger coins show no 1W trend rather than neutral
+                if len(klines_1w) >= TREND_PERIOD:
+                    trend_1w = self._determine_trend_from_klines(klines_1w)
+
+                is_ath, ath_price = self._check_ath(klines_1d, current_price)
+
+                # Get funding rate from the same exchange (refetch only if the
+                # klines came from a fallback exchange, while the chart renders)
+                if data_source == preferred_source:
+                    funding_rate = preferred_funding
+                    chart_image = await self._generate_chart(klines_1h, symbol)
+                else:
+                    funding_rate, chart_image = await asyncio.gather(
+                        self._fetch_funding_rate(symbol, data_source),
+                        self._generate_chart(klines_1h, symbol),
+                    )
+
+            return PumpSignal(
+                symbol=symbol,
+                price_change_percent=price_change_percent,
+                volume_24h=volume_24h,
+                current_price=current_price,
+                detected_at=datetime.now(timezone.utc),
+                rsi_1m=rsi_1m,
+                rsi_1h=rsi_1h,
+                trend_1d=trend_1d,
+                trend_1w=trend_1w,
+                btc_trend_1d=self._btc_trend_1d,
+                btc_trend_1w=self._btc_trend_1w,
+                funding_rate=funding_rate,
+                is_ath=is_ath,
+                ath_price=ath_price,
+                links=links,
+                data_source=data_source,
+                chart_image=chart_image,
+                reversal_history=reversal_history,
+            )
+
+        except Exception as e:
+            logger.error(f"{self.LOG_PREFIX} Error analyzing pump for {ticker.get('symbol', 'unknown')}: {e}")
+            return None
+
+    async def _get_reversal_history(self, symbol: str) -> ReversalHistory | None:
+        """Get reversal history for a coin from tracker."""
+        if not self._tracker:
+            return None
+
+        stats = await self._tracker.get_coin_stats(
+            symbol,
+            min_pumps=self._settings.min_pumps_for_history,
+        )
+        if not stats:
+            return None
+
+        last_results = await self._tracker.get_coin_last_results(symbol, 5)
+
+        return ReversalHistory(
+            total_pumps=stats.total_pumps,
+            avg_time_to_50pct=stats.avg_time_to_50pct_formatted,
+            pct_hit_50pct=stats.pct_hit_50pct,
+            avg_time_to_100pct=stats.avg_time_to_100pct_formatted,
+            pct_full_reversal=stats.pct_full_reversal,
+            avg_max_drop=stats.avg_max_drop_from_high,
+            last_results=last_results,
+            reliability_emoji=stats.reliability_emoji,
+        )
+
+    def _build_exchange_links(self, symbol: str) -> ExchangeLinks:
+        """Build exchange links for a symbol."""
+        links = ExchangeLinks(mexc=MEXCClient.get_futures_url(symbol))
+
+        if self._binance.has_symbol(symbol):
+            links.binance = BinanceClient.get_futures_url(symbol)
+
+        if self._bybit.has_symbol(symbol):
+            links.bybit = ByBitClient.get_futures_url(symbol)
+
+        if self._bingx.has_symbol(symbol):
+            links.bingx = BingXClient.get_futures_url(symbol)
+
+        return links
+
+    async def _update_btc_trend(self) -> None:
+        """Fetch BTC klines and update cached BTC trend.
+
+        Uses Binance as BTC is always available there.
+        """
+        try:
+            btc_symbol = "BTCUSDT"
+
+            # Fetch 1D and 1W klines for BTC concurrently
+            klines_1d, klines_1w = await asyncio.gather(
+                self._binance.get_klines(btc_symbol, "1d", 100),
+                self._binance.get_klines(btc_symbol, "1w", TREND_PERIOD),
+            )
+
+            # Calculate trends
+            if klines_1d and len(klines_1d) >= TREND_PERIOD:
+                self._btc_trend_1d = self._determine_trend_from_klines(klines_1d)
+            else:
+                self._btc_trend_1d = None
+
+            if klines_1w and len(klines_1w) >= TREND_PERIOD:
+                self._btc_trend_1w = self._determine_trend_from_klines(klines_1w)
+            else:
+                self._btc_trend_1w = None
+
+            logger.debug("{} BTC trend updated: 1D={}, 1W={}", self.LOG_PREFIX, self._btc_trend_1d, self._btc_trend_1w)
+
+        except Exception as e:
+            logger.warning(f"{self.LOG_PREFIX} Failed to fetch BTC trend: {e}")
+            self._btc_trend_1d = None
+            self._btc_trend_1w = None
+
+    def _preferred_data_source(self, symbol: str) -> str | None:
+        """Get the first exchange, in kline priority order, listing a symbol.
+
+        Returns:
+            Exchange name or None if no TA exchange lists the symbol.
+        """
+        if self._binance.has_symbol(symbol):
+            return "Binance"
+        if self._bybit.has_symbol(symbol):
+            return "ByBit"
+        if self._bingx.has_symbol(symbol):
+            return "BingX"
+        return None
+
+    async def _fetch_klines_from_any_exchange(
+        self,
+        symbol: str,
+    ) -> tuple[str, dict[str, list[dict[str, Any]]]] | None:
+        """Try to fetch klines from any available exchange.
+
+        Tries in order: Binance (fastest) -> ByBit -> BingX
+        Fetches extra 1H candles for chart generation.
+
+        Returns:
+            Tuple of (exchange_name, klines_data) or None if not available.
+        """
+        # Try Binance first (fastest and most reliable)
+        if self._binance.has_symbol(symbol):
+            logger.debug("{} Fetching {} data from Binance...", self.LOG_PREFIX, symbol)
+            klines = await self._fetch_klines_with_chart_data(self._binance, symbol)
+            if self._has_valid_klines(klines):
+                return ("Binance", klines)
+
+        # Try ByBit second
+        if self._bybit.has_symbol(symbol):
+            logger.debug("{} Fetching {} data from ByBit...", self.LOG_PREFIX, symbol)
+            klines = await self._fetch_klines_with_chart_data(self._bybit, symbol)
+            if self._has_valid_klines(klines):
+                return ("ByBit", klines)
+
+        # Try BingX last
+        if self._bingx.has_symbol(symbol):
+            logger.debug("{} Fetching {} data from BingX...", self.LOG_PREFIX, symbol)
+            klines = await self._fetch_klines_with_chart_data(self._bingx, symbol)
+            if self._has_valid_klines(klines):
+                return ("BingX", klines)
+
+        logger.debug("{} {} not available on any exchange for TA", self.LOG_PREFIX, symbol)
+        return None
+
+    async def _fetch_klines_with_chart_data(
+        self,
+        client: BinanceClient | ByBitClient | BingXClient,
+        symbol: str,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Fetch klines with extra 1H data for chart generation."""
+        # The chart's extended 1H history rides along in the same gather
+        return await client.get_multi_timeframe_klines(
+            symbol, limits={"1h": self.CHART_CANDLES}
+        )
+
+    def _has_valid_klines(self, klines: dict[str, list]) -> bool:
+        """Check if klines data has enough data for analysis."""
+        # Need at least 15 candles in 1m or 1h for RSI
+        return (
+            len(klines.get("1m", [])) >= 15 or
+            len(klines.get("1h", [])) >= 15
+        )
+
+    def _calculate_rsi_from_klines(self, klines: list[dict]) -> float | None:
+        """Calculate RSI from kline data."""
+        if not klines or len(klines) < 15:
+            return None
+
+        try:
+            closes = [k["close"] for k in klines]
+            return calculate_rsi(closes, period=14)
+        except (KeyError, TypeError) as e:
+            logger.debug("{} RSI calculation error: {}", self.LOG_PREFIX, e)
+            return None
+
+    def _determine_trend_from_klines(self, klines: list[dict]) -> Trend:
+        """Determine trend from kline data."""
+        if not klines or len(klines) < TREND_PERIOD:
+            return Trend.NEUTRAL
+
+        try:
+            closes = [k["close"] for k in klines[-TREND_PERIOD:]]
+            return determine_trend(closes)
+        except (KeyError, TypeError) as e:
+            logger.debug("{} Trend calculation error: {}", self.LOG_PREFIX, e)
+            return Trend.NEUTRAL
+
+    def _check_ath(
+        self,
+        klines: list[dict],
+        current_price: float,
+    ) -> tuple[bool, float | None]:
+        """Check if current price is at all-time high."""
+        if not klines:
+            return False, None
+
+        try:
+            highs = [k["high"] for k in klines]
+            if not highs:
+                return False, None
+
+            ath_price = max(highs)
+            is_ath = current_price >= ath_price * 0.99
+
+            return is_ath, ath_price
+
+        except (KeyError, TypeError) as e:
+            logger.debug("{} ATH check error: {}", self.LOG_PREFIX, e)
+            return False, None
+
+    async def _generate_chart(self, klines_1h: list[dict], symbol: str) -> bytes | None:
+        """Generate the signal chart from 1H klines, if there are enough.
+
+        Args:
+            klines_1h: 1H kline data (oldest to newest).
+            symbol: MEXC-format symbol.
+
+        Returns:
+            PNG image as bytes, or None.
+        """
+        if len(klines_1h) < 35:
+            return None
+
+        logger.debug("{} Generating chart for {}...", self.LOG_PREFIX, symbol)
+        return await self._chart_generator.generate_chart(klines_1h, symbol)
+
+    async def _fetch_funding_rate(
+        self,
+        symbol: str,
+        data_source: str | None,
+    ) -> float | None:
+        """Fetch funding rate from the specified exchange.
+
+        Args:
+            symbol: MEXC-format symbol.
+            data_source: Exchange name that provided kline data (None: no fetch).
+
+        Returns:
+            Funding rate as percentage or None.
+        """
+        try:
+            if data_source == "Binance":
+                return await self._binance.get_funding_rate(symbol)
+            elif data_source == "ByBit":
+                return await self._bybit.get_funding_rate(symbol)
+            elif data_source == "BingX":
+                return await self._bingx.get_funding_rate(symbol)
+        except Exception as e:
+            logger.debug("{} Funding rate fetch error for {}: {}", self.LOG_PREFIX, symbol, e)
+
+        return None
@@ -1,28 +1,70 @@
 """Binance Futures API client for fast technical data."""
 
 import asyncio
+import time
 from typing import Any
 
 import httpx
+import orjson
 from loguru import logger
 
+from src.utils.cache import (
+    SYMBOL_CACHE_TTL,
+    AsyncTTLCache,
+    load_cached_symbols,
+    save_cached_symbols,
+)
+from src.utils.http import acquire_client, release_client
+from src.utils.indicators import TREND_PERIOD
+
 
 class BinanceClient:
     """Fast async client for Binance Futures API (public data only)."""
 
     BASE_URL = "https://fapi.binance.com"
 
+    # Daily/weekly candles barely move between scans, so they are cached and
+    # shared across client instances (e.g. every detector's BTC trend lookup)
+    CACHED_INTERVALS = frozenset({"1d", "1w"})
+    _klines_cache = AsyncTTLCache(maxsize=1024, ttl=300)
+
+    # Intraday candles are cached per wall-clock minute, so detectors asking
+    # for the same symbol within a minute share one request
+    _recent_klines_cache = AsyncTTLCache(maxsize=2048, ttl=60)
+
+    # Candles fetched per timeframe by get_multi_timeframe_klines
+    TIMEFRAME_LIMITS = {
+        "1m": 30,
+        "1h": 30,
+        "1d": 100,
+        "1w": TREND_PERIOD,  # determine_trend needs this many closes
+    }
+
+    # Symbol list shared by all instances; concurrent loads share one fetch
+    _symbols_cache = AsyncTTLCache(maxsize=1, ttl=SYMBOL_CACHE_TTL)
+
     def __init__(self) -> None:
         """Initialize the Binance client."""
         self._client: httpx.AsyncClient | None = None
-        self._available_symbols: set[str] | None = None
+        self._available_symbols: frozenset[str] | None = None
 
     async def __aenter__(self) -> "BinanceClient":
         """Enter async context."""
-        self._client = httpx.AsyncClient(
-            base_url=self.BASE_URL,
-            timeout=httpx.Timeout(10.0, connect=5.0),
-            headers={"Content-Type": "application/json"},
+        # One connection pool per exchange, shared with other open instances
+        self._client = acquire_client(
+            self.BASE_URL,
+            lambda: httpx.AsyncClient(
+                base_url=self.BASE_URL,
+                timeout=httpx.Timeout(10.0, connect=5.0),
+                headers={"Content-Type": "application/json"},
+                # Keep idle connections past the scan interval so each cycle
+                # reuses them instead of redoing the TCP + TLS handshake
+                limits=httpx.Limits(
+                    max_connections=50,
+                    max_keepalive_connections=32,
+                    keepalive_expiry=90.0,
+                ),
+            ),
         )
         # Pre-fetch available symbols
         await self._load_symbols()
@@ -31,22 +73,40 @@ class BinanceClient:
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """Exit async context."""
         if self._client:
-            await self._client.aclose()
+            await release_client(self.BASE_URL)
 
     async def _load_symbols(self) -> None:
         """Load available Binance futures symbols."""
+        # Instances opened side by side (see run_all.py) share one load
+        self._available_symbols = await self._symbols_cache.get_or_fetch(
+            "symbols", self._fetch_symbols
+        ) or frozenset()
+
+    async def _fetch_symbols(self) -> frozenset[str]:
+        """Fetch Binance futures symbols, preferring the on-disk cache.
+
+        Returns:
+            Tradable symbols (empty on error).
+        """
+        cached = load_cached_symbols("binance")
+        if cached:
+            logger.info(f"Loaded {len(cached)} Binance futures symbols (cached)")
+            return cached
+
         try:
             response = await self._client.get("/fapi/v1/exchangeInfo")
             response.raise_for_status()
-            data = response.json()
-            self._available_symbols = {
+            data = orjson.loads(response.content)
+            symbols = frozenset(
                 s["symbol"] for s in data.get("symbols", [])
                 if s.get("status") == "TRADING"
-            }
-            logger.info(f"Loaded {len(self._available_symbols)} Binance futures symbols")
+            )
+            save_cached_symbols("binance", symbols)
+            logger.info(f"Loaded {len(symbols)} Binance futures symbols")
+            return symbols
         except Exception as e:
             logger.warning(f"Failed to load Binance symbols: {e}")
-            self._available_symbols = set()
+            return frozenset()
 
     def _convert_symbol(self, mexc_symbol: str) -> str | None:
         """Convert MEXC symbol format to Binance format.
@@ -87,6 +147,32 @@ class BinanceClient:
         if not binance_symbol:
             return []
 
+        if interval in self.CACHED_INTERVALS:
+            return await self._klines_cache.get_or_fetch(
+                (binance_symbol, interval, limit),
+                lambda: self._fetch_klines(binance_symbol, interval, limit),
+            )
+        return await self._recent_klines_cache.get_or_fetch(
+            (binance_symbol, interval, limit, int(time.time() // 60)),
+            lambda: self._fetch_klines(binance_symbol, interval, limit),
+        )
+
+    async def _fetch_klines(
+        self,
+        binance_symbol: str,
+        interval: str,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """Fetch kline data from the API.
+
+        Args:
+            binance_symbol: Binance-format symbol (e.g., BTCUSDT).
+            interval: Candle interval.
+            limit: Number of candles to fetch.
+
+        Returns:
+            List of kline data (empty on error).
+        """
         try:
             response = await self._client.get(
                 "/fapi/v1/klines",
@@ -97,7 +183,7 @@ class BinanceClient:
                 },
             )
             response.raise_for_status()
-            raw_klines = response.json()
+            raw_klines = orjson.loads(response.content)
 
             # Convert Binance format to our standard format
             # Binance: [openTime, open, high, low, close, volume, closeTime, ...]
@@ -115,32 +201,29 @@ class BinanceClient:
             return klines
 
         except Exception as e:
-            logger.debug(f"Binance klines error for {symbol}: {e}")
+            logger.debug("Binance klines error for {}: {}", binance_symbol, e)
             return []
 
     async def get_multi_timeframe_klines(
         self,
         symbol: str,
+        limits: dict[str, int] | None = None,
     ) -> dict[str, list[dict[str, Any]]]:
         """Get klines for multiple timeframes concurrently.
 
         Args:
             symbol: MEXC-format symbol (e.g., BTC_USDT).
+            limits: Per-timeframe candle counts overriding TIMEFRAME_LIMITS.
 
         Returns:
             Dict mapping interval name to kline data.
         """
-        intervals = {
-            "1m": ("1m", 30),
-            "1h": ("1h", 30),
-            "1d": ("1d", 100),
-            "1w": ("1w", 8),  # 8 weeks for trend analysis (4 min, 8 optimal)
-        }
+        timeframe_limits = {**self.TIMEFRAME_LIMITS, **limits} if limits else self.TIMEFRAME_LIMITS
 
         # Fetch all timeframes concurrently (Binance is fast!)
         tasks = {
-            name: self.get_klines(symbol, interval, limit)
-            for name, (interval, limit) in intervals.items()
+            name: self.get_klines(symbol, name, limit)
+            for name, limit in timeframe_limits.items()
         }
 
         results = await asyncio.gather(*tasks.values(), return_exceptions=True)
@@ -175,7 +258,7 @@ class BinanceClient:
                 },
             )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             
             if data and len(data) > 0:
                 # Binance returns funding rate as decimal (0.0001 = 0.01%)
@@ -184,7 +267,7 @@ class BinanceClient:
             return None
 
         except Exception as e:
-            logger.debug(f"Binance funding rate error for {symbol}: {e}")
+            logger.debug("Binance funding rate error for {}: {}", symbol, e)
             return None
 
     def has_symbol(self, mexc_symbol: str) -> bool:
@@ -1,28 +1,70 @@
 """BingX Futures API client for technical data."""
 
 import asyncio
+import time
 from typing import Any
 
 import httpx
+import orjson
 from loguru import logger
 
+from src.utils.cache import (
+    SYMBOL_CACHE_TTL,
+    AsyncTTLCache,
+    load_cached_symbols,
+    save_cached_symbols,
+)
+from src.utils.http import acquire_client, release_client
+from src.utils.indicators import TREND_PERIOD
+
 
 class BingXClient:
     """Fast async client for BingX Futures API (public data only)."""
 
     BASE_URL = "https://open-api.bingx.com"
 
+    # Daily/weekly candles barely move between scans, so they are cached and
+    # shared across client instances
+    CACHED_INTERVALS = frozenset({"1d", "1w"})
+    _klines_cache = AsyncTTLCache(maxsize=1024, ttl=300)
+
+    # Intraday candles are cached per wall-clock minute, so detectors asking
+    # for the same symbol within a minute share one request
+    _recent_klines_cache = AsyncTTLCache(maxsize=2048, ttl=60)
+
+    # Candles fetched per timeframe by get_multi_timeframe_klines
+    TIMEFRAME_LIMITS = {
+        "1m": 30,
+        "1h": 30,
+        "1d": 100,
+        "1w": TREND_PERIOD,  # determine_trend needs this many closes
+    }
+
+    # Symbol list shared by all instances; concurrent loads share one fetch
+    _symbols_cache = AsyncTTLCache(maxsize=1, ttl=SYMBOL_CACHE_TTL)
+
     def __init__(self) -> None:
         """Initialize the BingX client."""
         self._client: httpx.AsyncClient | None = None
-        self._available_symbols: set[str] | None = None
+        self._available_symbols: frozenset[str] | None = None
 
     async def __aenter__(self) -> "BingXClient":
         """Enter async context."""
-        self._client = httpx.AsyncClient(
-            base_url=self.BASE_URL,
-            timeout=httpx.Timeout(10.0, connect=5.0),
-            headers={"Content-Type": "application/json"},
+        # One connection pool per exchange, shared with other open instances
+        self._client = acquire_client(
+            self.BASE_URL,
+            lambda: httpx.AsyncClient(
+                base_url=self.BASE_URL,
+                timeout=httpx.Timeout(10.0, connect=5.0),
+                headers={"Content-Type": "application/json"},
+                # Keep idle connections past the scan interval so each cycle
+                # reuses them instead of redoing the TCP + TLS handshake
+                limits=httpx.Limits(
+                    max_connections=50,
+                    max_keepalive_connections=32,
+                    keepalive_expiry=90.0,
+                ),
+            ),
         )
         await self._load_symbols()
         return self
@@ -30,26 +72,43 @@ class BingXClient:
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """Exit async context."""
         if self._client:
-            await self._client.aclose()
+            await release_client(self.BASE_URL)
 
     async def _load_symbols(self) -> None:
         """Load available BingX perpetual futures symbols."""
+        # Instances opened side by side (see run_all.py) share one load
+        self._available_symbols = await self._symbols_cache.get_or_fetch(
+            "symbols", self._fetch_symbols
+        ) or frozenset()
+
+    async def _fetch_symbols(self) -> frozenset[str]:
+        """Fetch BingX perpetual futures symbols, preferring the on-disk cache.
+
+        Returns:
+            Tradable symbols (empty on error).
+        """
+        cached = load_cached_symbols("bingx")
+        if cached:
+            logger.info(f"Loaded {len(cached)} BingX futures symbols (cached)")
+            return cached
+
         try:
             response = await self._client.get("/openApi/swap/v2/quote/contracts")
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             if data.get("code") == 0:
-                self._available_symbols = {
+                symbols = frozenset(
                     s["symbol"] for s in data.get("data", [])
                     if s.get("status") == 1
-                }
-                logger.info(f"Loaded {len(self._available_symbols)} BingX futures symbols")
-            else:
-                self._available_symbols = set()
+                )
+                save_cached_symbols("bingx", symbols)
+                logger.info(f"Loaded {len(symbols)} BingX futures symbols")
+                return symbols
+            return frozenset()
         except Exception as e:
             logger.warning(f"Failed to load BingX symbols: {e}")
-            self._available_symbols = set()
+            return frozenset()
 
     def _convert_symbol(self, mexc_symbol: str) -> str | None:
         """Convert MEXC symbol to BingX format.
@@ -90,6 +149,32 @@ class BingXClient:
         if not bingx_symbol:
             return []
 
+        if interval in self.CACHED_INTERVALS:
+            return await self._klines_cache.get_or_fetch(
+                (bingx_symbol, interval, limit),
+                lambda: self._fetch_klines(bingx_symbol, interval, limit),
+            )
+        return await self._recent_klines_cache.get_or_fetch(
+            (bingx_symbol, interval, limit, int(time.time() // 60)),
+            lambda: self._fetch_klines(bingx_symbol, interval, limit),
+        )
+
+    async def _fetch_klines(
+        self,
+        bingx_symbol: str,
+        interval: str,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """Fetch kline data from the API.
+
+        Args:
+            bingx_symbol: BingX-format symbol (e.g., BTC-USDT).
+            interval: Candle interval.
+            limit: Number of candles to fetch.
+
+        Returns:
+            List of kline data (empty on error).
+        """
         try:
             response = await self._client.get(
                 "/openApi/swap/v3/quote/klines",
@@ -100,7 +185,7 @@ class BingXClient:
                 },
             )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             if data.get("code") != 0:
                 return []
@@ -124,24 +209,28 @@ class BingXClient:
             return klines
 
         except Exception as e:
-            logger.debug(f"BingX klines error for {symbol}: {e}")
+            logger.debug("BingX klines error for {}: {}", bingx_symbol, e)
             return []
 
     async def get_multi_timeframe_klines(
         self,
         symbol: str,
+        limits: dict[str, int] | None = None,
     ) -> dict[str, list[dict[str, Any]]]:
-        """Get klines for multiple timeframes concurrently."""
-        intervals = {
-            "1m": ("1m", 30),
-            "1h": ("1h", 30),
-            "1d": ("1d", 100),
-            "1w": ("1w", 8),  # 8 weeks for trend analysis (4 min, 8 optimal)
-        }
+        """Get klines for multiple timeframes concurrently.
+
+        Args:
+            symbol: MEXC-format symbol (e.g., BTC_USDT).
+            limits: Per-timeframe candle counts overriding TIMEFRAME_LIMITS.
+
+        Returns:
+            Dict mapping interval name to kline data.
+        """
+        timeframe_limits = {**self.TIMEFRAME_LIMITS, **limits} if limits else self.TIMEFRAME_LIMITS
 
         tasks = {
-            name: self.get_klines(symbol, interval, limit)
-            for name, (interval, limit) in intervals.items()
+            name: self.get_klines(symbol, name, limit)
+            for name, limit in timeframe_limits.items()
         }
 
         results = await asyncio.gather(*tasks.values(), return_exceptions=True)
@@ -173,7 +262,7 @@ class BingXClient:
                 params={"symbol": bingx_symbol},
             )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             if data.get("code") == 0 and data.get("data"):
                 # BingX returns funding rate as decimal
@@ -182,7 +271,7 @@ class BingXClient:
             return None
 
         except Exception as e:
-            logger.debug(f"BingX funding rate error for {symbol}: {e}")
+            logger.debug("BingX funding rate error for {}: {}", symbol, e)
             return None
 
     def has_symbol(self, mexc_symbol: str) -> bool:
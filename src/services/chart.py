@@ -1,19 +1,39 @@
 """Chart generation service for pump signals."""
 
+import asyncio
 import io
+import multiprocessing
+import os
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, partial
 from typing import Any
 
+import matplotlib
+
+# Headless rendering: select Agg before pyplot so no GUI backend is probed
+matplotlib.use("Agg")
+
+import numpy as np
 import pandas as pd
 import mplfinance as mpf
 import matplotlib.pyplot as plt
+from matplotlib.collections import PolyCollection
+from matplotlib.transforms import Bbox
 from loguru import logger
 
 from src.utils.indicators import calculate_rsi_series, calculate_macd
 from src.utils.levels import detect_support_resistance, LevelType
 
 
+@lru_cache(maxsize=1)
 def create_dark_style() -> mpf.make_mpf_style:
-    """Create a dark theme style for mplfinance."""
+    """Create a dark theme style for mplfinance.
+
+    Built once per process and shared by every detector's ChartGenerator;
+    mplfinance only reads the style, so sharing it is safe.
+    """
     mc = mpf.make_marketcolors(
         up="#26a69a",
         down="#ef5350",
@@ -56,16 +76,101 @@ class ChartGenerator:
         """Initialize the chart generator."""
         self._style = create_dark_style()
 
+    # Recently rendered charts, shared by all instances: detectors running
+    # side by side often alert the same pump from the same cached klines
+    RENDER_CACHE_SIZE = 32
+    _rendered: OrderedDict[tuple, bytes] = OrderedDict()
+
+    # Charts render in worker processes, created on first use and shared by
+    # all instances: rendering is CPU-bound, pyplot is not thread-safe, and
+    # rendering inline would stall the event loop for every detector. Sized
+    # by the CPUs this process may run on (taskset/cpuset limits), not the
+    # host's count, so a pinned container doesn't oversubscribe its cores
+    RENDER_WORKERS = min(
+        4,
+        len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1,
+    )
+    _render_pool: ProcessPoolExecutor | None = None
+
     # Number of candles needed for MACD warmup (26 slow + 9 signal)
     INDICATOR_WARMUP = 40
 
-    def generate_chart(
+    # Kline dict keys used for charting, and their mplfinance column names
+    OHLCV_COLUMNS = {
+        "open": "Open",
+        "high": "High",
+        "low": "Low",
+        "close": "Close",
+        "volume": "Volume",
+    }
+
+    # Indicator line panels: dataframe column and its make_addplot styling
+    INDICATOR_PLOTS = (
+        ("RSI", {"panel": 2, "color": "#b39ddb", "ylabel": "RSI", "ylim": (0, 100)}),
+        ("MACD", {"panel": 3, "color": "#2196f3", "ylabel": "MACD"}),
+        ("Signal", {"panel": 3, "color": "#ff9800"}),
+    )
+
+    # RSI oversold/overbought reference levels and their line colors
+    RSI_BANDS = ((30.0, "#4caf50"), (70.0, "#f44336"))
+
+    # mpf.plot returns a primary and a secondary axis per panel; the MACD
+    # panel (3) primary is the one its lines and histogram share
+    MACD_AXES_INDEX = 6
+
+    # MACD histogram bar width in candle widths
+    HISTOGRAM_BAR_WIDTH = 0.7
+
+    # Label tag and line/label color per support/resistance level type
+    LEVEL_STYLES = {
+        LevelType.RESISTANCE: ("R", "#ff5252"),
+        LevelType.SUPPORT: ("S", "#4caf50"),
+    }
+
+    # Annotation styling shared by every level label
+    LEVEL_LABEL_KWARGS = {
+        "xytext": (5, 0),
+        "textcoords": "offset points",
+        "fontsize": 8,
+        "fontweight": "bold",
+        "verticalalignment": "center",
+    }
+    LEVEL_LABEL_BOX = {"boxstyle": "round,pad=0.2", "facecolor": "#131722", "alpha": 0.8}
+
+    # Telegram downscales photos to 1280px on the long side; at this dpi the
+    # cropped figure (SAVE_BBOX, 11.7in wide) comes out ~1275px wide, so no
+    # pixels are wasted
+    CHART_DPI = 109
+
+    # Saved area of the 12x10in figure, in inches. bbox_inches="tight" costs
+    # an extra layout pass per chart to measure this; only the right edge
+    # varies (price label width, 12.2-12.5in), so a fixed box covers it
+    SAVE_BBOX = Bbox.from_extents(0.9, 0.77, 12.6, 9.95)
+
+    # mpf.plot arguments that are the same for every chart
+    BASE_PLOT_KWARGS = {
+        "type": "candle",
+        "ylabel": "Price",
+        "volume": True,
+        "volume_panel": 1,
+        "panel_ratios": (3, 1, 1, 1),  # Price, Volume, RSI, MACD
+        "figsize": (12, 10),
+        "tight_layout": True,
+        "returnfig": True,
+        "datetime_format": "%m-%d %H:%M",
+        "xrotation": 0,
+    }
+
+    async def generate_chart(
         self,
         klines: list[dict[str, Any]],
         symbol: str,
     ) -> bytes | None:
         """Generate a candlestick chart with indicators.
 
+        Rendering runs in the shared worker process pool, so concurrent
+        pumps render in parallel while the event loop keeps running.
+
         Args:
             klines: List of kline data (1H timeframe, oldest to newest).
             symbol: Trading pair symbol for the title.
@@ -79,6 +184,108 @@ class ChartGenerator:
             )
             return None
 
+        # The last candle is still forming, so its close/volume are part of
+        # the key; any update to the data renders a fresh chart
+        last = klines[-1]
+        cache_key = (symbol, len(klines), last["time"], last["close"], last["volume"])
+        cached = self._rendered.get(cache_key)
+        if cached:
+            self._rendered.move_to_end(cache_key)
+            return cached
+
+        try:
+            try:
+                chart = await self._render_in_pool(klines, symbol)
+            except BrokenProcessPool as e:
+                # A worker died (e.g. OOM-killed) and took the pool with it;
+                # the pool has been reset, so retry once on a fresh one
+                logger.warning(f"Chart render pool broke, restarting it: {e}")
+                chart = await self._render_in_pool(klines, symbol)
+        except Exception as e:
+            logger.error(f"Failed to generate chart for {symbol}: {e}")
+            return None
+
+        if chart:
+            self._rendered[cache_key] = chart
+            if len(self._rendered) > self.RENDER_CACHE_SIZE:
+                self._rendered.popitem(last=False)
+        return chart
+
+    @classmethod
+    def _get_render_pool(cls) -> ProcessPoolExecutor:
+        """Get the shared chart render pool, starting it on first use."""
+        if cls._render_pool is None:
+            # spawn: forking a process that runs threads (event loop helpers,
+            # enqueued log sinks) can deadlock the child
+            cls._render_pool = ProcessPoolExecutor(
+                max_workers=cls.RENDER_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return cls._render_pool
+
+    @classmethod
+    def _reset_render_pool(cls, pool: ProcessPoolExecutor) -> None:
+        """Discard a broken render pool so the next chart starts a new one.
+
+        Args:
+            pool: The pool that broke; a newer pool is left untouched.
+        """
+        if cls._render_pool is pool:
+            cls._render_pool = None
+        pool.shutdown(wait=False)
+
+    @classmethod
+    async def _render_in_pool(cls, klines: list[dict[str, Any]], symbol: str) -> bytes | None:
+        """Render a chart in the shared pool, resetting the pool if it broke.
+
+        Raises:
+            BrokenProcessPool: A worker died; the pool has been reset.
+        """
+        pool = cls._get_render_pool()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                pool, _render_chart_in_worker, klines, symbol
+            )
+        except BrokenProcessPool:
+            cls._reset_render_pool(pool)
+            raise
+
+    @classmethod
+    def warm_up(cls) -> None:
+        """Start a render worker ahead of the first chart.
+
+        Spawning the worker, importing matplotlib/mplfinance and loading
+        fonts on the first draw take ~0.6s; doing it at startup overlaps that
+        with the first scan's network I/O instead of delaying the first alert.
+        """
+        pool = cls._get_render_pool()
+        try:
+            future = pool.submit(_warm_up_worker)
+        except BrokenProcessPool as e:
+            logger.warning(f"Chart render warm-up failed: {e}")
+            cls._reset_render_pool(pool)
+            return
+        future.add_done_callback(partial(cls._warm_up_done, pool))
+
+    @classmethod
+    def _warm_up_done(cls, pool: ProcessPoolExecutor, future: Future) -> None:
+        """Log a failed warm-up and drop the pool if it broke."""
+        if future.cancelled() or future.exception() is None:
+            return
+        logger.warning(f"Chart render warm-up failed: {future.exception()}")
+        if isinstance(future.exception(), BrokenProcessPool):
+            cls._reset_render_pool(pool)
+
+    def render_chart(self, klines: list[dict[str, Any]], symbol: str) -> bytes | None:
+        """Render a chart in the current process (no caching).
+
+        Args:
+            klines: List of kline data (1H timeframe, oldest to newest).
+            symbol: Trading pair symbol for the title.
+
+        Returns:
+            PNG image as bytes, or None if generation fails.
+        """
         try:
             # Convert to DataFrame
             df = self._prepare_dataframe(klines)
@@ -125,22 +332,26 @@ class ChartGenerator:
     def _prepare_dataframe(self, klines: list[dict]) -> pd.DataFrame | None:
         """Convert klines to pandas DataFrame for mplfinance."""
         try:
-            data = []
-            for k in klines:
-                data.append(
-                    {
-                        "Date": pd.to_datetime(k["time"], unit="ms"),
-                        "Open": float(k["open"]),
-                        "High": float(k["high"]),
-                        "Low": float(k["low"]),
-                        "Close": float(k["close"]),
-                        "Volume": float(k.get("volume", 0)),
-                    }
-                )
+            # Typed columns and the time index built straight from the klines
+            # and passed to one DataFrame constructor, with no intermediate
+            # frame, column copies or index reassignment
+            count = len(klines)
+            times = np.fromiter((k["time"] for k in klines), dtype=np.int64, count=count)
+            columns = {
+                column: np.fromiter((k[key] for k in klines), dtype=np.float64, count=count)
+                for key, column in self.OHLCV_COLUMNS.items()
+            }
+            # Patch missing volume on the array, not through a column reassignment
+            np.nan_to_num(columns["Volume"], copy=False, nan=0.0)
+            df = pd.DataFrame(
+                columns,
+                # A plain cast of the epoch-ms ints, skipping pd.to_datetime's parsing
+                index=pd.DatetimeIndex(times.astype("datetime64[ms]"), name="Date"),
+            )
 
-            df = pd.DataFrame(data)
-            df.set_index("Date", inplace=True)
-            df.sort_index(inplace=True)
+            # Clients return candles oldest first; only sort if they didn't
+            if not df.index.is_monotonic_increasing:
+                df.sort_index(inplace=True)
 
             return df
 
@@ -158,86 +369,33 @@ class ChartGenerator:
         try:
             add_plots = []
 
-            # RSI panel
-            rsi_plot = mpf.make_addplot(
-                df["RSI"],
-                panel=2,
-                color="#b39ddb",
-                ylabel="RSI",
-                ylim=(0, 100),
-                secondary_y=False,
-            )
-            add_plots.append(rsi_plot)
-
-            # RSI levels (30 and 70)
-            df["RSI_30"] = 30
-            df["RSI_70"] = 70
-            rsi_30_plot = mpf.make_addplot(
-                df["RSI_30"],
-                panel=2,
-                color="#4caf50",
-                linestyle="--",
-                width=0.7,
-                secondary_y=False,
-            )
-            rsi_70_plot = mpf.make_addplot(
-                df["RSI_70"],
-                panel=2,
-                color="#f44336",
-                linestyle="--",
-                width=0.7,
-                secondary_y=False,
-            )
-            add_plots.extend([rsi_30_plot, rsi_70_plot])
-
-            # MACD panel
-            macd_plot = mpf.make_addplot(
-                df["MACD"],
-                panel=3,
-                color="#2196f3",
-                ylabel="MACD",
-                secondary_y=False,
-            )
-            signal_plot = mpf.make_addplot(
-                df["Signal"],
-                panel=3,
-                color="#ff9800",
-                secondary_y=False,
-            )
-            add_plots.extend([macd_plot, signal_plot])
-
-            # MACD Histogram
-            hist_colors = [
-                "#26a69a" if v >= 0 else "#ef5350" for v in df["Histogram"].fillna(0)
-            ]
-            histogram_plot = mpf.make_addplot(
-                df["Histogram"],
-                panel=3,
-                type="bar",
-                color=hist_colors,
-                secondary_y=False,
-                width=0.7,
-            )
-            add_plots.append(histogram_plot)
+            # RSI and MACD/signal lines, with RSI reference levels on its panel
+            for column, style in self.INDICATOR_PLOTS:
+                add_plots.append(
+                    mpf.make_addplot(df[column], secondary_y=False, **style)
+                )
+                if column == "RSI":
+                    add_plots.extend(
+                        mpf.make_addplot(
+                            np.full(len(df), level),
+                            panel=2,
+                            color=color,
+                            linestyle="--",
+                            width=0.7,
+                            secondary_y=False,
+                        )
+                        for level, color in self.RSI_BANDS
+                    )
 
             # Create horizontal lines for support/resistance
             hlines_dict = self._create_hlines(levels, df)
 
             # Build plot kwargs
             plot_kwargs = {
-                "type": "candle",
+                **self.BASE_PLOT_KWARGS,
                 "style": self._style,
                 "title": f"\n{symbol} (1H)",
-                "ylabel": "Price",
-                "volume": True,
-                "volume_panel": 1,
                 "addplot": add_plots,
-                "panel_ratios": (3, 1, 1, 1),  # Price, Volume, RSI, MACD
-                "figsize": (12, 10),
-                "tight_layout": True,
-                "returnfig": True,
-                "datetime_format": "%m-%d %H:%M",
-                "xrotation": 0,
             }
 
             # Only add hlines if we have levels
@@ -247,6 +405,8 @@ class ChartGenerator:
             # Create figure
             fig, axes = mpf.plot(df, **plot_kwargs)
 
+            self._add_macd_histogram(axes[self.MACD_AXES_INDEX], df["Histogram"].to_numpy())
+
             # Add level annotations
             if levels:
                 self._add_level_annotations(axes[0], levels, df)
@@ -256,10 +416,13 @@ class ChartGenerator:
             fig.savefig(
                 buf,
                 format="png",
-                dpi=150,
-                bbox_inches="tight",
+                dpi=self.CHART_DPI,
+                bbox_inches=self.SAVE_BBOX,
                 facecolor="#131722",
                 edgecolor="none",
+                # Rendering runs off the event loop, so spend a little encode
+                # time on a smaller upload
+                pil_kwargs={"compress_level": 6},
             )
             buf.seek(0)
             plt.close(fig)
@@ -270,37 +433,52 @@ class ChartGenerator:
             logger.error(f"Failed to render chart: {e}")
             return None
 
+    def _add_macd_histogram(self, ax, histogram: np.ndarray) -> None:
+        """Draw the MACD histogram as one collection of bars.
+
+        A type="bar" addplot goes through ax.bar, which creates, transforms
+        and autoscales a separate Rectangle artist per candle.
+        """
+        # Bars sit at the candles' integer x positions, like mplfinance's
+        x = np.flatnonzero(~np.isnan(histogram))
+        heights = histogram[x]
+        left = x - self.HISTOGRAM_BAR_WIDTH / 2
+        right = x + self.HISTOGRAM_BAR_WIDTH / 2
+        zeros = np.zeros(len(x))
+        bars = np.stack(
+            (
+                np.column_stack((left, zeros)),
+                np.column_stack((left, heights)),
+                np.column_stack((right, heights)),
+                np.column_stack((right, zeros)),
+            ),
+            axis=1,
+        )
+
+        collection = PolyCollection(
+            bars,
+            facecolors=np.where(heights >= 0, "#26a69a", "#ef5350"),
+            edgecolors="none",
+        )
+        # Like ax.bar: no autoscale margin past the zero baseline
+        collection.sticky_edges.y.append(0)
+        ax.add_collection(collection)
+        ax.autoscale_view(scalex=False)
+
     def _create_hlines(self, levels: list, df: pd.DataFrame) -> dict | None:
         """Create horizontal lines configuration for mplfinance."""
         if not levels:
             return None
 
-        resistance_prices = []
-        support_prices = []
-
-        for level in levels:
-            if level.level_type == LevelType.RESISTANCE:
-                resistance_prices.append(level.price)
-            else:
-                support_prices.append(level.price)
-
-        all_prices = resistance_prices + support_prices
-        if not all_prices:
-            return None
-
-        # Create colors list matching the order
-        colors = ["#ff5252" for _ in resistance_prices] + [  # Red for resistance
-            "#4caf50" for _ in support_prices
-        ]  # Green for support
-
-        # Create linestyles
-        linestyles = ["--" for _ in all_prices]
+        # Resistance lines first, then support (sort is stable within each)
+        ordered = sorted(levels, key=lambda level: level.level_type != LevelType.RESISTANCE)
+        count = len(ordered)
 
         return {
-            "hlines": all_prices,
-            "colors": colors,
-            "linestyle": linestyles,
-            "linewidths": [1.5 for _ in all_prices],
+            "hlines": [level.price for level in ordered],
+            "colors": [self.LEVEL_STYLES[level.level_type][1] for level in ordered],
+            "linestyle": ["--"] * count,
+            "linewidths": [1.5] * count,
         }
 
     def _add_level_annotations(
@@ -314,28 +492,34 @@ class ChartGenerator:
         x_pos = len(df) - 1
 
         for level in levels:
-            # Determine label and color
-            if level.level_type == LevelType.RESISTANCE:
-                color = "#ff5252"
-                label = f"R ({level.touches}x)"
-            else:
-                color = "#4caf50"
-                label = f"S ({level.touches}x)"
+            tag, color = self.LEVEL_STYLES[level.level_type]
 
             # Add text annotation on the right side
             ax.annotate(
-                label,
+                f"{tag} ({level.touches}x)",
                 xy=(x_pos, level.price),
-                xytext=(5, 0),
-                textcoords="offset points",
-                fontsize=8,
                 color=color,
-                fontweight="bold",
-                verticalalignment="center",
-                bbox=dict(
-                    boxstyle="round,pad=0.2",
-                    facecolor="#131722",
-                    edgecolor=color,
-                    alpha=0.8,
-                ),
+                bbox={**self.LEVEL_LABEL_BOX, "edgecolor": color},
+                **self.LEVEL_LABEL_KWARGS,
             )
+
+
+def _warm_up_worker() -> None:
+    """Render a throwaway chart so the worker's font cache and renderer are warm."""
+    klines = [
+        {
+            "time": hour * 3_600_000,
+            "open": 1.0,
+            "high": 1.1 + hour % 3 / 10,
+            "low": 0.9,
+            "close": 1.0 + hour % 5 / 20,
+            "volume": 1.0,
+        }
+        for hour in range(60)
+    ]
+    ChartGenerator().render_chart(klines, "WARMUP")
+
+
+def _render_chart_in_worker(klines: list[dict[str, Any]], symbol: str) -> bytes | None:
+    """Render a chart inside a render pool worker process."""
+    return ChartGenerator().render_chart(klines, symbol)
@@ -1,12 +1,16 @@
 """MEXC Futures API client."""
 
 import asyncio
+import time
 from typing import Any
 
 import httpx
+import orjson
 from loguru import logger
 
-from src.config import Settings
+from src.config import DetectorSettings
+from src.utils.http import acquire_client, release_client
+from src.utils.ratelimit import TokenBucket
 
 
 class MEXCClient:
@@ -20,7 +24,31 @@ class MEXCClient:
     INTERVAL_4H = "Hour4"
     INTERVAL_1D = "Day1"
 
-    def __init__(self, settings: Settings) -> None:
+    # (interval, candles) fetched per timeframe by get_multi_timeframe_klines
+    TIMEFRAME_LIMITS = {
+        "1m": (INTERVAL_1M, 30),   # 30 candles for RSI
+        "1h": (INTERVAL_1H, 30),   # 30 candles for RSI
+        "4h": (INTERVAL_4H, 25),   # For trend analysis
+        "1d": (INTERVAL_1D, 100),  # For ATH and trend
+    }
+
+    # Ticker snapshots are keyed on a time block of this many seconds and
+    # shared by all client instances, so scanners running side by side
+    # (see run_all.py) reuse one bulk ticker download instead of each
+    # fetching their own.
+    TICKER_CACHE_SECONDS = 2
+    _ticker_cache: dict[str, tuple[int, list[dict[str, Any]]]] = {}
+    _ticker_lock = asyncio.Lock()
+
+    # MEXC allows 20 public market requests per 2 seconds per IP; the bucket
+    # is shared by all client instances since they share the IP
+    _rate_limiter = TokenBucket(rate=10, capacity=20)
+
+    # Responses worth retrying: rate limiting and transient server errors.
+    # Other 4xx errors fail the same way on every attempt
+    RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(self, settings: DetectorSettings) -> None:
         """Initialize the MEXC client.
 
         Args:
@@ -31,18 +59,28 @@ class MEXCClient:
 
     async def __aenter__(self) -> "MEXCClient":
         """Enter async context."""
-        self._client = httpx.AsyncClient(
-            base_url=self._base_url,
-            timeout=httpx.Timeout(60.0, connect=10.0),  # Increased timeout
-            headers={"Content-Type": "application/json"},
-            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        # One connection pool per exchange, shared with other open instances
+        self._client = acquire_client(
+            self._base_url,
+            lambda: httpx.AsyncClient(
+                base_url=self._base_url,
+                timeout=httpx.Timeout(60.0, connect=10.0),  # Increased timeout
+                headers={"Content-Type": "application/json"},
+                # Keep idle connections past the scan interval so each cycle
+                # reuses them instead of redoing the TCP + TLS handshake
+                limits=httpx.Limits(
+                    max_connections=20,
+                    max_keepalive_connections=10,
+                    keepalive_expiry=90.0,
+                ),
+            ),
         )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """Exit async context."""
         if self._client:
-            await self._client.aclose()
+            await release_client(self._base_url)
 
     async def _request(
         self,
@@ -69,25 +107,87 @@ class MEXCClient:
         last_error = None
         for attempt in range(retries):
             try:
+                await self._rate_limiter.acquire()
                 response = await self._client.get(endpoint, params=params)
                 response.raise_for_status()
-                return response.json()
-            except (httpx.TimeoutException, httpx.HTTPStatusError) as e:
+                return self._decode_body(response.content)
+            except httpx.HTTPStatusError as e:
+                last_error = e
+                if e.response.status_code not in self.RETRY_STATUS_CODES:
+                    break
+            except httpx.TransportError as e:
+                # Timeouts, and pooled connections the server closed while idle
                 last_error = e
-                if attempt < retries - 1:
-                    wait_time = (attempt + 1) * 2  # Exponential backoff: 2, 4, 6 seconds
-                    logger.debug(f"Request failed, retrying in {wait_time}s... ({e})")
-                    await asyncio.sleep(wait_time)
-                continue
             except httpx.HTTPError as e:
                 last_error = e
                 break
 
+            if attempt < retries - 1:
+                wait_time = self._retry_delay(last_error, attempt)
+                logger.debug("Request failed, retrying in {}s... ({})", wait_time, last_error)
+                await asyncio.sleep(wait_time)
+
         raise last_error if last_error else httpx.HTTPError("Unknown error")
 
+    @staticmethod
+    def _retry_delay(error: httpx.HTTPError, attempt: int) -> float:
+        """Get the wait before retrying a failed request.
+
+        Args:
+            error: Error raised by the failed attempt.
+            attempt: Zero-based attempt number.
+
+        Returns:
+            Seconds to wait: the server's Retry-After on 429, else 2, 4, 6...
+        """
+        backoff = (attempt + 1) * 2
+        if isinstance(error, httpx.HTTPStatusError) and error.response.status_code == 429:
+            try:
+                return max(float(error.response.headers["Retry-After"]), backoff)
+            except (KeyError, ValueError):
+                pass
+        return backoff
+
+    @staticmethod
+    def _decode_body(body: bytes) -> dict:
+        """Decode a JSON response body.
+
+        Args:
+            body: Raw response bytes.
+
+        Returns:
+            Decoded JSON data.
+
+        Raises:
+            httpx.DecodingError: If the body is not valid JSON (e.g. an HTML
+                error page served with a 200 status).
+        """
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError as e:
+            kind = "HTML page" if body.lstrip()[:1] == b"<" else "invalid JSON"
+            raise httpx.DecodingError(f"Got {kind} instead of JSON: {body[:200]!r}") from e
+
     async def get_all_tickers(self) -> list[dict[str, Any]]:
         """Get ticker data for all futures symbols.
 
+        Returns:
+            List of ticker data dictionaries.
+        """
+        async with self._ticker_lock:
+            block = int(time.time() // self.TICKER_CACHE_SECONDS)
+            cached = self._ticker_cache.get(self._base_url)
+            if cached and cached[0] == block:
+                return cached[1]
+
+            tickers = await self._fetch_all_tickers()
+            if tickers:
+                self._ticker_cache[self._base_url] = (block, tickers)
+            return tickers
+
+    async def _fetch_all_tickers(self) -> list[dict[str, Any]]:
+        """Fetch ticker data for all futures symbols from the API.
+
         Returns:
             List of ticker data dictionaries.
         """
@@ -177,7 +277,7 @@ class MEXCClient:
             return klines
 
         except Exception as e:
-            logger.debug(f"Error parsing kline arrays: {e}")
+            logger.debug("Error parsing kline arrays: {}", e)
             return []
 
     async def get_multi_timeframe_klines(
@@ -192,25 +292,19 @@ class MEXCClient:
         Returns:
             Dict mapping interval to kline data.
         """
-        intervals = {
-            "1m": (self.INTERVAL_1M, 30),   # 30 candles for RSI
-            "1h": (self.INTERVAL_1H, 30),   # 30 candles for RSI
-            "4h": (self.INTERVAL_4H, 25),   # For trend analysis
-            "1d": (self.INTERVAL_1D, 100),  # For ATH and trend
+        # Fetch all timeframes concurrently; the shared rate limiter paces
+        # the requests instead of a fixed sleep after each one
+        tasks = {
+            name: self.get_klines(symbol, interval, limit)
+            for name, (interval, limit) in self.TIMEFRAME_LIMITS.items()
         }
 
-        # Fetch sequentially with small delays to avoid rate limiting
-        results = {}
-        for name, (interval, limit) in intervals.items():
-            try:
-                klines = await self.get_klines(symbol, interval, limit)
-                results[name] = klines
-                await asyncio.sleep(0.1)  # Small delay between requests
-            except Exception as e:
-                logger.debug(f"Error fetching {interval} klines for {symbol}: {e}")
-                results[name] = []
-
-        return results
+        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+        return {
+            name: result if isinstance(result, list) else []
+            for name, result in zip(tasks.keys(), results)
+        }
 
     @staticmethod
     def get_futures_url(symbol: str) -> str:
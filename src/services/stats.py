@@ -1,13 +1,9 @@
 """Statistics formatting service."""
 
-from datetime import datetime, timezone, timedelta
+import time
 
 from src.database.db import Database
-from src.database.models import CoinStats
-
-
-# UTC+3 timezone
-UTC_PLUS_3 = timezone(timedelta(hours=3))
+from src.database.models import CoinStats, format_duration, format_utc3_clock
 
 
 class StatsFormatter:
@@ -28,20 +24,15 @@ class StatsFormatter:
             Formatted message string.
         """
         stats = await self._db.get_global_stats()
-        now = datetime.now(UTC_PLUS_3)
 
         # Format average time
         avg_time = "N/A"
         if stats.avg_time_to_50pct_seconds:
-            hours = stats.avg_time_to_50pct_seconds / 3600
-            if hours < 1:
-                avg_time = f"{stats.avg_time_to_50pct_seconds / 60:.0f}m"
-            else:
-                avg_time = f"{hours:.1f}h"
+            avg_time = format_duration(stats.avg_time_to_50pct_seconds)
 
         lines = [
             "📊 <b>PUMP REVERSAL STATISTICS</b>",
-            f"<i>Last Updated: {now.strftime('%H:%M')} (UTC+3)</i>",
+            f"<i>Last Updated: {format_utc3_clock(time.time(), with_seconds=False)} (UTC+3)</i>",
             "",
             "━━━ <b>All-Time Performance</b> ━━━",
             "",
@@ -56,11 +47,7 @@ class StatsFormatter:
             # Format average time to 100%
             avg_time_100 = "N/A"
             if stats.avg_time_to_100pct_seconds:
-                hours_100 = stats.avg_time_to_100pct_seconds / 3600
-                if hours_100 < 1:
-                    avg_time_100 = f"{stats.avg_time_to_100pct_seconds / 60:.0f}m"
-                else:
-                    avg_time_100 = f"{hours_100:.1f}h"
+                avg_time_100 = format_duration(stats.avg_time_to_100pct_seconds)
 
             lines.extend(
                 [
@@ -77,7 +64,7 @@ class StatsFormatter:
             lines.append("━━━ <b>Top Reversal Coins</b> ━━━")
             lines.append("")
             for i, (symbol, rate, count) in enumerate(stats.top_coins[:5], start=1):
-                coin_name = symbol.replace("_USDT", "")
+                coin_name = symbol.removesuffix("_USDT")
                 lines.append(f"{i}. {coin_name} - <b>{rate:.0f}%</b> ({count} pumps)")
             lines.append("")
 
@@ -86,7 +73,7 @@ class StatsFormatter:
             lines.append("━━━ <b>Avoid These</b> ━━━")
             lines.append("")
             for i, (symbol, rate, count) in enumerate(stats.worst_coins[:3], start=1):
-                coin_name = symbol.replace("_USDT", "")
+                coin_name = symbol.removesuffix("_USDT")
                 lines.append(f"⚠️ {coin_name} - <b>{rate:.0f}%</b> ({count} pumps)")
             lines.append("")
 
@@ -3,9 +3,11 @@
 import asyncio
 
 from aiogram import Bot
+from aiogram.client.session.aiohttp import AiohttpSession
 from aiogram.enums import ParseMode
 from aiogram.types import LinkPreviewOptions, BufferedInputFile
 from aiogram.exceptions import TelegramBadRequest, TelegramRetryAfter
+import orjson
 from loguru import logger
 
 from src.config import Settings
@@ -16,6 +18,17 @@ from src.database.db import Database
 class TelegramNotifier:
     """Sends notifications to Telegram."""
 
+    # Signals uploaded in parallel per batch; Telegram throttles bursts to a
+    # single chat, so keep this small and let the RetryAfter handling absorb
+    # anything beyond it
+    MAX_CONCURRENT_SENDS = 3
+
+    # aiogram session (the connection pool to api.telegram.org), shared by
+    # the notifiers of detectors running side by side in run_all.py and
+    # closed when the last of them closes
+    _session: AiohttpSession | None = None
+    _session_users = 0
+
     def __init__(self, settings: Settings, database: Database | None = None) -> None:
         """Initialize the Telegram notifier.
 
@@ -23,15 +36,33 @@ class TelegramNotifier:
             settings: Application settings.
             database: Database for storing pinned message IDs.
         """
-        self._bot = Bot(token=settings.telegram_bot_token)
+        self._bot = Bot(token=settings.telegram_bot_token, session=self._acquire_session())
         self._chat_id = settings.telegram_chat_id
         self._db = database
         # Disable link previews
         self._link_preview = LinkPreviewOptions(is_disabled=True)
 
+    @classmethod
+    def _acquire_session(cls) -> AiohttpSession:
+        """Get the shared bot session, creating it on first use."""
+        if cls._session is None:
+            # orjson (de)serializes the Bot API payloads instead of stdlib json
+            cls._session = AiohttpSession(
+                json_loads=orjson.loads,
+                json_dumps=lambda value: orjson.dumps(value).decode(),
+            )
+        cls._session_users += 1
+        return cls._session
+
     async def close(self) -> None:
-        """Close the bot session."""
-        await self._bot.session.close()
+        """Release the bot session, closing it once no notifier uses it."""
+        cls = type(self)
+        cls._session_users -= 1
+        if cls._session_users > 0 or cls._session is None:
+            return
+
+        session, cls._session = cls._session, None
+        await session.close()
 
     async def send_signal(self, signal: PumpSignal, max_retries: int = 3) -> bool:
         """Send a pump signal to Telegram.
@@ -45,16 +76,22 @@ class TelegramNotifier:
         Returns:
             True if sent successfully, False otherwise.
         """
+        try:
+            # Build the payload once; rate-limit retries resend the same one
+            message = signal.format_message()
+            photo = (
+                BufferedInputFile(signal.chart_image, filename=f"{signal.symbol}_chart.png")
+                if signal.chart_image
+                else None
+            )
+        except Exception as e:
+            logger.error(f"Failed to send Telegram message for {signal.symbol}: {e}")
+            return False
+
         for attempt in range(max_retries):
             try:
-                message = signal.format_message()
-
-                if signal.chart_image:
+                if photo:
                     # Send as photo with caption
-                    photo = BufferedInputFile(
-                        signal.chart_image,
-                        filename=f"{signal.symbol}_chart.png",
-                    )
                     await self._bot.send_photo(
                         chat_id=self._chat_id,
                         photo=photo,
@@ -97,16 +134,23 @@ class TelegramNotifier:
         Returns:
             Number of successfully sent messages.
         """
-        sent_count = 0
-        for i, signal in enumerate(signals):
-            if await self.send_signal(signal):
-                sent_count += 1
-            
-            # Small delay between messages to avoid rate limiting
-            if i < len(signals) - 1:
-                await asyncio.sleep(0.5)
-        
-        return sent_count
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SENDS)
+        # Signals still waiting for a send slot
+        queued = len(signals)
+
+        async def send(signal: PumpSignal) -> bool:
+            nonlocal queued
+            async with semaphore:
+                queued -= 1
+                sent = await self.send_signal(signal)
+                # Small delay before freeing the slot to avoid rate limiting,
+                # skipped once no other signal is waiting for it
+                if queued:
+                    await asyncio.sleep(0.5)
+                return sent
+
+        results = await asyncio.gather(*(send(signal) for signal in signals))
+        return sum(results)
 
     async def send_startup_message(self, auto_delete_seconds: int = 5) -> bool:
         """Send a startup notification that auto-deletes.
@@ -145,7 +189,7 @@ class TelegramNotifier:
             await asyncio.sleep(seconds)
             await self._bot.delete_message(chat_id=self._chat_id, message_id=message_id)
         except Exception as e:
-            logger.debug(f"Could not delete startup message: {e}")
+            logger.debug("Could not delete startup message: {}", e)
 
     async def update_stats_message(self, stats_text: str, max_retries: int = 3) -> bool:
         """Update or create the pinned stats message.
@@ -77,8 +77,9 @@ class PumpTracker:
         
         # Add to active monitoring
         self._active_pumps[record.id] = record
+        self._price_cache[symbol] = price_at_detection
         
-        logger.debug(f"Started monitoring {symbol} pump +{pump_percent:.1f}%")
+        logger.debug("Started monitoring {} pump +{:.1f}%", symbol, pump_percent)
         
         return record
     
@@ -88,10 +89,17 @@ class PumpTracker:
         Args:
             tickers: List of ticker data from MEXC.
         """
+        # Only monitored symbols are ever read back, so skip parsing the rest
+        watched = {record.symbol for record in self._active_pumps.values()}
+        if not watched:
+            return
+
         for ticker in tickers:
             symbol = ticker.get("symbol", "")
+            if symbol not in watched:
+                continue
             price = ticker.get("lastPrice")
-            if symbol and price:
+            if price:
                 self._price_cache[symbol] = float(price)
     
     async def check_active_pumps(self) -> list[PumpRecord]:
@@ -101,6 +109,7 @@ class PumpTracker:
             List of pumps that completed monitoring this cycle.
         """
         completed = []
+        updated = []
         now = datetime.now(timezone.utc)
         
         for pump_id, record in list(self._active_pumps.items()):
@@ -132,7 +141,7 @@ class PumpTracker:
             
             if retrace_pct >= 25 and record.time_to_25pct_retrace is None:
                 record.time_to_25pct_retrace = elapsed_seconds
-                logger.debug(f"{record.symbol} hit 25% retrace in {elapsed_seconds/60:.1f}m")
+                logger.debug("{} hit 25% retrace in {:.1f}m", record.symbol, elapsed_seconds/60)
             
             if retrace_pct >= 50 and record.time_to_50pct_retrace is None:
                 record.time_to_50pct_retrace = elapsed_seconds
@@ -140,7 +149,7 @@ class PumpTracker:
             
             if retrace_pct >= 75 and record.time_to_75pct_retrace is None:
                 record.time_to_75pct_retrace = elapsed_seconds
-                logger.debug(f"{record.symbol} hit 75% retrace in {elapsed_seconds/60:.1f}m")
+                logger.debug("{} hit 75% retrace in {:.1f}m", record.symbol, elapsed_seconds/60)
             
             if retrace_pct >= 100 and record.time_to_100pct_retrace is None:
                 record.time_to_100pct_retrace = elapsed_seconds
@@ -168,8 +177,10 @@ class PumpTracker:
                     f"(max drop: {record.max_drop_from_high_pct:.1f}%)"
                 )
             
-            # Save updated record
-            await self._db.update_pump(record)
+            updated.append(record)
+        
+        # Save the whole cycle's updates in one transaction
+        await self._db.update_pumps(updated)
         
         return completed
     
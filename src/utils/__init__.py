@@ -1,5 +1,7 @@
 """Utility functions for the pump detector."""
 
+from src.utils.cache import AsyncTTLCache
+from src.utils.eventloop import run_event_loop
 from src.utils.indicators import (
     calculate_rsi,
     calculate_rsi_series,
@@ -7,9 +9,11 @@ from src.utils.indicators import (
     calculate_ema,
     determine_trend,
     Trend,
+    TREND_PERIOD,
     get_trend_emoji,
     get_rsi_emoji,
 )
+from src.utils.ratelimit import TokenBucket
 from src.utils.levels import (
     detect_support_resistance,
     get_levels_for_chart,
@@ -18,16 +22,20 @@ from src.utils.levels import (
 )
 
 __all__ = [
+    "AsyncTTLCache",
+    "run_event_loop",
     "calculate_rsi",
     "calculate_rsi_series",
     "calculate_macd",
     "calculate_ema",
     "determine_trend",
     "Trend",
+    "TREND_PERIOD",
     "get_trend_emoji",
     "get_rsi_emoji",
     "detect_support_resistance",
     "get_levels_for_chart",
     "PriceLevel",
     "LevelType",
+    "TokenBucket",
 ]
@@ -0,0 +1,149 @@
+"""In-memory caching helpers."""
+
+import asyncio
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+import orjson
+from loguru import logger
+
+SYMBOL_CACHE_DIR = Path("data/cache")
+SYMBOL_CACHE_TTL = 3600
+
+
+class AsyncTTLCache:
+    """TTL cache for coroutine results with single-flight loading.
+
+    Concurrent lookups of the same missing key share one in-flight fetch
+    instead of each issuing their own request. Empty results (the clients
+    return ``[]``/``None`` on errors) are never cached.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached entries (oldest evicted first).
+            ttl: Seconds before an entry expires.
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._pending: dict[Hashable, asyncio.Task] = {}
+
+    async def get_or_fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return the cached value for key, fetching it on a miss.
+
+        Args:
+            key: Cache key.
+            fetch: Zero-argument coroutine function producing the value.
+
+        Returns:
+            Cached or freshly fetched value.
+        """
+        entry = self._entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._pending[key] = task
+            task.add_done_callback(lambda t: self._store(key, t))
+
+        # Shield so one cancelled waiter doesn't cancel the shared fetch
+        return await asyncio.shield(task)
+
+    def _store(self, key: Hashable, task: asyncio.Task) -> None:
+        """Store a finished fetch result."""
+        self._pending.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+
+        value = task.result()
+        if not value:
+            return
+
+        now = time.monotonic()
+        self._entries[key] = (now + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+        # Entries share one TTL, so expired ones are always at the front
+        while self._entries:
+            expires_at, _ = next(iter(self._entries.values()))
+            if expires_at > now:
+                break
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+
+@cache
+def _symbol_cache_dir() -> Path:
+    """Create the symbol cache directory (once per process) and return it."""
+    SYMBOL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    return SYMBOL_CACHE_DIR
+
+
+def _symbol_cache_path(name: str) -> Path:
+    """Path of the on-disk symbol list for an exchange."""
+    return SYMBOL_CACHE_DIR / f"{name}_symbols.json"
+
+
+def load_cached_symbols(name: str, ttl: float = SYMBOL_CACHE_TTL) -> frozenset[str] | None:
+    """Load an exchange symbol list saved by a previous run.
+
+    Args:
+        name: Exchange name used as the cache file prefix.
+        ttl: Maximum file age in seconds.
+
+    Returns:
+        Cached symbols, or None if missing, stale or unreadable.
+    """
+    path = _symbol_cache_path(name)
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        symbols = frozenset(orjson.loads(path.read_bytes()))
+    except (OSError, orjson.JSONDecodeError, TypeError):
+        return None
+    return symbols or None
+
+
+def save_cached_symbols(name: str, symbols: Iterable[str]) -> None:
+    """Persist an exchange symbol list for the next process start.
+
+    Args:
+        name: Exchange name used as the cache file prefix.
+        symbols: Symbols to store.
+    """
+    path = _symbol_cache_path(name)
+    tmp_path: str | None = None
+    try:
+        # Unique temp file per write: detectors under run_all.py share one
+        # process, so a pid-based name could be written by two savers at once
+        fd, tmp_path = tempfile.mkstemp(
+            dir=_symbol_cache_dir(), prefix=f"{path.name}.", suffix=".tmp"
+        )
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(sorted(symbols)))
+        # Atomic swap so detectors started side by side never read a partial file
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Failed to save {name} symbol cache: {e}")
+        if tmp_path:
+            Path(tmp_path).unlink(missing_ok=True)
@@ -0,0 +1,50 @@
+"""Event loop selection for the detector entry points."""
+
+import asyncio
+import os
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from loguru import logger
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
+EVENT_LOOP_ENV = "EVENT_LOOP"
+
+
+def _select_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Pick the event loop implementation from the EVENT_LOOP variable.
+
+    Supported values are ``auto`` (uvloop when installed, the default),
+    ``uvloop`` and ``asyncio``.
+
+    Returns:
+        Loop factory for asyncio.Runner, or None for the stdlib loop.
+    """
+    choice = os.environ.get(EVENT_LOOP_ENV, "auto").strip().lower()
+
+    if choice == "asyncio":
+        return None
+
+    if choice not in ("auto", "uvloop"):
+        logger.warning(f"Unknown {EVENT_LOOP_ENV}={choice!r}, using auto")
+    elif choice == "uvloop" and uvloop is None:
+        logger.warning(f"{EVENT_LOOP_ENV}=uvloop but uvloop is not installed")
+
+    return uvloop.new_event_loop if uvloop is not None else None
+
+
+def run_event_loop(main: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine on the configured event loop.
+
+    Args:
+        main: Coroutine to run to completion.
+
+    Returns:
+        The coroutine's result.
+    """
+    with asyncio.Runner(loop_factory=_select_loop_factory()) as runner:
+        return runner.run(main)
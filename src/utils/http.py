@@ -0,0 +1,53 @@
+"""Shared HTTP client helpers."""
+
+from collections.abc import Callable
+
+import httpx
+
+# Open clients and their user counts, keyed by base URL
+_clients: dict[str, httpx.AsyncClient] = {}
+_users: dict[str, int] = {}
+
+
+def acquire_client(
+    base_url: str,
+    factory: Callable[[], httpx.AsyncClient],
+) -> httpx.AsyncClient:
+    """Get the shared client for a base URL, creating it on first use.
+
+    Exchange clients opened side by side (e.g. one per detector in
+    run_all.py) share one connection pool per exchange this way instead
+    of each keeping their own sockets open.
+
+    Args:
+        base_url: API base URL the client is shared for.
+        factory: Creates the client when none is open yet.
+
+    Returns:
+        Shared httpx client. Pair every call with release_client().
+    """
+    client = _clients.get(base_url)
+    if client is None or client.is_closed:
+        client = factory()
+        _clients[base_url] = client
+        _users[base_url] = 0
+
+    _users[base_url] += 1
+    return client
+
+
+async def release_client(base_url: str) -> None:
+    """Release a shared client, closing it once its last user is done.
+
+    Args:
+        base_url: API base URL passed to acquire_client().
+    """
+    users = _users.get(base_url, 0) - 1
+    if users > 0:
+        _users[base_url] = users
+        return
+
+    _users.pop(base_url, None)
+    client = _clients.pop(base_url, None)
+    if client:
+        await client.aclose()
@@ -100,31 +100,27 @@ def cluster_levels(
         return []
 
     # Sort by price
-    sorted_levels = sorted(levels, key=lambda x: x[1])
+    prices = sorted(p for _, p in levels)
 
+    # Keep a running sum/count per cluster instead of collecting its members
     clusters = []
-    current_cluster = [sorted_levels[0]]
-
-    for i in range(1, len(sorted_levels)):
-        _, prev_price = sorted_levels[i - 1]
-        _, curr_price = sorted_levels[i]
+    prev_price = total = prices[0]
+    count = 1
 
+    for price in prices[1:]:
         # Check if within threshold
-        pct_diff = abs(curr_price - prev_price) / prev_price * 100
-
-        if pct_diff <= threshold_pct:
-            current_cluster.append(sorted_levels[i])
+        if abs(price - prev_price) / prev_price * 100 <= threshold_pct:
+            total += price
+            count += 1
         else:
             # Save current cluster and start new one
-            if current_cluster:
-                avg_price = sum(p for _, p in current_cluster) / len(current_cluster)
-                clusters.append((avg_price, len(current_cluster)))
-            current_cluster = [sorted_levels[i]]
+            clusters.append((total / count, count))
+            total = price
+            count = 1
+        prev_price = price
 
     # Don't forget last cluster
-    if current_cluster:
-        avg_price = sum(p for _, p in current_cluster) / len(current_cluster)
-        clusters.append((avg_price, len(current_cluster)))
+    clusters.append((total / count, count))
 
     # Sort by touch count descending
     clusters.sort(key=lambda x: x[1], reverse=True)
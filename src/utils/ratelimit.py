@@ -0,0 +1,44 @@
+"""Request rate limiting helpers."""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Async token bucket rate limiter.
+
+    Allows bursts of up to ``capacity`` requests and refills at ``rate``
+    tokens per second, so callers only wait once the burst is used up
+    instead of sleeping a fixed delay after every request.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Initialize the bucket (starts full).
+
+        Args:
+            rate: Tokens added per second.
+            capacity: Maximum number of stored tokens (burst size).
+        """
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Take one token, waiting for a refill if the bucket is empty."""
+        # Waiters queue on the lock, so tokens are handed out in FIFO order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._updated) * self._rate,
+                )
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self._rate)
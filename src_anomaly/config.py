@@ -3,21 +3,14 @@
 from functools import lru_cache
 
 from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from src.config import DetectorSettings
 
-class AnomalySettings(BaseSettings):
-    """Anomaly detector settings loaded from environment variables."""
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-    )
+class AnomalySettings(DetectorSettings):
+    """Anomaly detector settings loaded from environment variables."""
 
     # Telegram configuration
-    telegram_bot_token: str = Field(..., description="Telegram bot token")
     anomaly_telegram_chat_id: str = Field(
         ..., description="Anomaly detector Telegram chat/channel ID"
     )
@@ -40,18 +33,6 @@ class AnomalySettings(BaseSettings):
         description="Minimum pump percentage in single 5M candle",
     )
 
-    # Scan settings
-    scan_interval_seconds: int = Field(
-        default=60,
-        description="Interval between scans in seconds",
-    )
-
-    # MEXC API settings
-    mexc_futures_base_url: str = Field(
-        default="https://contract.mexc.com",
-        description="MEXC Futures API base URL",
-    )
-
     # Tracking settings
     monitoring_hours: int = Field(
         default=48,
@@ -62,9 +43,6 @@ class AnomalySettings(BaseSettings):
         description="Minimum previous pumps to show coin history in signals",
     )
 
-    # Logging
-    log_level: str = Field(default="INFO", description="Logging level")
-
 
 @lru_cache
 def get_anomaly_settings() -> AnomalySettings:
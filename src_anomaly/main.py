@@ -2,7 +2,7 @@
 
 import asyncio
 import sys
-from datetime import datetime, timezone
+import time
 
 from loguru import logger
 
@@ -16,6 +16,7 @@ from src.services.bingx import BingXClient
 from src.services.telegram import TelegramNotifier
 from src.services.tracker import PumpTracker
 from src.services.stats import StatsFormatter
+from src.utils.eventloop import run_event_loop
 
 
 def setup_logging(log_level: str) -> None:
@@ -25,14 +26,18 @@ def setup_logging(log_level: str) -> None:
         log_level: Logging level string.
     """
     logger.remove()
+    # enqueue=True hands records to a background thread, so writes (and the
+    # daily rotation/compression) never block the event loop mid-scan
     logger.add(
         sys.stderr,
         level=log_level.upper(),
+        enqueue=True,
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
     )
     logger.add(
         "logs/anomaly_detector_{time:YYYY-MM-DD}.log",
         level=log_level.upper(),
+        enqueue=True,
         rotation="1 day",
         retention="7 days",
         compression="zip",
@@ -105,7 +110,13 @@ async def run_scanner() -> None:
             stats_text = await stats_formatter.format_global_stats_message()
             await telegram.update_stats_message(stats_text)
 
+            loop = asyncio.get_running_loop()
+
             while True:
+                # Scans run on a fixed cadence: the wait below excludes the
+                # time spent scanning and alerting
+                cycle_started = loop.time()
+
                 try:
                     logger.debug("[ANOMALY] Starting scan cycle...")
                     
@@ -128,7 +139,8 @@ async def run_scanner() -> None:
                             detector.remove_completed_alerts([p.symbol for p in completed])
 
                     # Update stats hourly
-                    current_hour = datetime.now(timezone.utc).hour
+                    # Whole hours since the epoch: ticks over on each UTC hour
+                    current_hour = int(time.time() // 3600)
                     if current_hour != last_stats_hour:
                         last_stats_hour = current_hour
                         logger.info("[ANOMALY] Hourly stats update...")
@@ -138,9 +150,10 @@ async def run_scanner() -> None:
                 except Exception as e:
                     logger.error(f"[ANOMALY] Error during scan cycle: {e}")
 
-                # Wait before next scan
-                logger.debug(f"[ANOMALY] Sleeping for {settings.scan_interval_seconds}s...")
-                await asyncio.sleep(settings.scan_interval_seconds)
+                # Wait until the next scan is due (immediately if this one overran)
+                delay = max(0.0, cycle_started + settings.scan_interval_seconds - loop.time())
+                logger.debug("[ANOMALY] Sleeping for {:.1f}s...", delay)
+                await asyncio.sleep(delay)
 
     except KeyboardInterrupt:
         logger.info("[ANOMALY] Shutting down...")
@@ -153,7 +166,7 @@ async def run_scanner() -> None:
 def main() -> None:
     """Entry point."""
     try:
-        asyncio.run(run_scanner())
+        run_event_loop(run_scanner())
     except KeyboardInterrupt:
         pass
 
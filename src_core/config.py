@@ -3,21 +3,14 @@
 from functools import lru_cache
 
 from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from src.config import DetectorSettings
 
-class CoreSettings(BaseSettings):
-    """Core detector settings loaded from environment variables."""
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-    )
+class CoreSettings(DetectorSettings):
+    """Core detector settings loaded from environment variables."""
 
     # Telegram configuration
-    telegram_bot_token: str = Field(..., description="Telegram bot token")
     core_telegram_chat_id: str = Field(..., description="Core detector Telegram chat/channel ID")
 
     # Core pump detection settings
@@ -30,27 +23,12 @@ class CoreSettings(BaseSettings):
         description="Minimum 24h volume in USD to track a pump",
     )
     
-    # Scan settings
-    scan_interval_seconds: int = Field(
-        default=60,
-        description="Interval between scans in seconds",
-    )
-
     # Watchlist settings
     watchlist_file: str = Field(
         default="watchlist.txt",
         description="Path to watchlist file with coin symbols",
     )
 
-    # MEXC API settings
-    mexc_futures_base_url: str = Field(
-        default="https://contract.mexc.com",
-        description="MEXC Futures API base URL",
-    )
-
-    # Logging
-    log_level: str = Field(default="INFO", description="Logging level")
-
 
 @lru_cache
 def get_core_settings() -> CoreSettings:
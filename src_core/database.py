@@ -4,6 +4,8 @@ import aiosqlite
 from pathlib import Path
 from loguru import logger
 
+from src.database.db import SQLITE_PRAGMAS
+
 
 class CoreDatabase:
     """Minimal database for core detector to track alerted symbols."""
@@ -24,6 +26,7 @@ class CoreDatabase:
         
         self._conn = await aiosqlite.connect(self._db_path)
         self._conn.row_factory = aiosqlite.Row
+        await self._conn.executescript(SQLITE_PRAGMAS)
         
         await self._create_tables()
         logger.info(f"Core database connected: {self._db_path}")
@@ -106,7 +109,7 @@ class CoreDatabase:
                 WHERE datetime(detected_at) < datetime('now', '-' || ? || ' days')
             """, (days,))
             await self._conn.commit()
-            logger.debug(f"Cleaned up alerts older than {days} days")
+            logger.debug("Cleaned up alerts older than {} days", days)
         except Exception as e:
             logger.error(f"Error cleaning up old alerts: {e}")
 
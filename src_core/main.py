@@ -14,6 +14,7 @@ from src.services.mexc import MEXCClient
 from src.services.binance import BinanceClient
 from src.services.bybit import ByBitClient
 from src.services.bingx import BingXClient
+from src.utils.eventloop import run_event_loop
 
 
 def setup_logging(log_level: str) -> None:
@@ -23,14 +24,18 @@ def setup_logging(log_level: str) -> None:
         log_level: Logging level string.
     """
     logger.remove()
+    # enqueue=True hands records to a background thread, so writes (and the
+    # daily rotation/compression) never block the event loop mid-scan
     logger.add(
         sys.stderr,
         level=log_level.upper(),
+        enqueue=True,
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
     )
     logger.add(
         "logs/core_detector_{time:YYYY-MM-DD}.log",
         level=log_level.upper(),
+        enqueue=True,
         rotation="1 day",
         retention="7 days",
         compression="zip",
@@ -63,8 +68,6 @@ async def run_scanner() -> None:
     # Initialize Telegram
     telegram = CoreTelegramNotifier(settings)
 
-    # Track reload counter (reload watchlist every 10 cycles)
-    reload_counter = 0
     cleanup_counter = 0
 
     try:
@@ -87,19 +90,22 @@ async def run_scanner() -> None:
                 bingx_client,
             )
 
+            loop = asyncio.get_running_loop()
+
             while True:
+                # Scans run on a fixed cadence: the wait below excludes the
+                # time spent scanning and alerting
+                cycle_started = loop.time()
+
                 try:
-                    # Reload watchlist periodically (every 10 scans)
-                    reload_counter += 1
-                    if reload_counter >= 10:
-                        watchlist.reload()
-                        reload_counter = 0
-                        
-                        # If watchlist becomes empty, warn and wait
-                        if watchlist.count == 0:
-                            logger.warning("Watchlist is empty! Waiting...")
-                            await asyncio.sleep(settings.scan_interval_seconds)
-                            continue
+                    # Pick up watchlist edits (only re-read when the file changed)
+                    watchlist.reload()
+
+                    # If watchlist becomes empty, warn and wait
+                    if watchlist.count == 0:
+                        logger.warning("Watchlist is empty! Waiting...")
+                        await asyncio.sleep(settings.scan_interval_seconds)
+                        continue
 
                     logger.debug("Starting scan cycle...")
                     
@@ -131,9 +137,10 @@ async def run_scanner() -> None:
                 except Exception as e:
                     logger.error(f"Error during scan cycle: {e}")
 
-                # Wait before next scan
-                logger.debug(f"Sleeping for {settings.scan_interval_seconds}s...")
-                await asyncio.sleep(settings.scan_interval_seconds)
+                # Wait until the next scan is due (immediately if this one overran)
+                delay = max(0.0, cycle_started + settings.scan_interval_seconds - loop.time())
+                logger.debug("Sleeping for {:.1f}s...", delay)
+                await asyncio.sleep(delay)
 
     except KeyboardInterrupt:
         logger.info("Shutting down...")
@@ -146,7 +153,7 @@ async def run_scanner() -> None:
 def main() -> None:
     """Entry point."""
     try:
-        asyncio.run(run_scanner())
+        run_event_loop(run_scanner())
     except KeyboardInterrupt:
         pass
 
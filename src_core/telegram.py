@@ -1,6 +1,9 @@
 """Telegram notification service for core detector."""
 
+import asyncio
+
 import aiohttp
+import orjson
 from loguru import logger
 
 from src_core.config import CoreSettings
@@ -10,6 +13,9 @@ from src.models.signal import PumpSignal
 class CoreTelegramNotifier:
     """Sends pump alerts to Telegram - simplified version for core detector."""
 
+    # Signals uploaded in parallel per batch (Telegram throttles chat bursts)
+    MAX_CONCURRENT_SENDS = 3
+
     def __init__(self, settings: CoreSettings) -> None:
         """Initialize Telegram notifier.
 
@@ -23,7 +29,19 @@ class CoreTelegramNotifier:
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            # Keep the connection to api.telegram.org open between scan
+            # cycles so alerts skip the TCP + TLS handshake, and bound each
+            # request so a stalled upload can't hold a send slot for minutes
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.MAX_CONCURRENT_SENDS * 2,
+                    keepalive_timeout=75,
+                    ttl_dns_cache=300,
+                ),
+                timeout=aiohttp.ClientTimeout(total=30, connect=10),
+                # Serialize request bodies with orjson instead of stdlib json
+                json_serialize=lambda value: orjson.dumps(value).decode(),
+            )
         return self._session
 
     async def close(self) -> None:
@@ -40,32 +58,46 @@ class CoreTelegramNotifier:
         Returns:
             Number of successfully sent messages.
         """
-        sent_count = 0
-
-        for signal in signals:
-            try:
-                # Format message
-                message_text = signal.format_message()
-
-                # Send with chart if available
-                if signal.chart_image:
-                    success = await self._send_photo(
-                        message_text,
-                        signal.chart_image,
-                    )
-                else:
-                    success = await self._send_message(message_text)
-
-                if success:
-                    sent_count += 1
-                    logger.info(f"Sent alert for {signal.symbol}")
-                else:
-                    logger.warning(f"Failed to send alert for {signal.symbol}")
-
-            except Exception as e:
-                logger.error(f"Error sending signal for {signal.symbol}: {e}")
-
-        return sent_count
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SENDS)
+
+        async def send(signal: PumpSignal) -> bool:
+            async with semaphore:
+                return await self._send_signal(signal)
+
+        results = await asyncio.gather(*(send(signal) for signal in signals))
+        return sum(results)
+
+    async def _send_signal(self, signal: PumpSignal) -> bool:
+        """Send a single pump signal alert.
+
+        Args:
+            signal: The pump signal to send.
+
+        Returns:
+            True if sent successfully.
+        """
+        try:
+            # Format message
+            message_text = signal.format_message()
+
+            # Send with chart if available
+            if signal.chart_image:
+                success = await self._send_photo(
+                    message_text,
+                    signal.chart_image,
+                )
+            else:
+                success = await self._send_message(message_text)
+
+            if success:
+                logger.info(f"Sent alert for {signal.symbol}")
+            else:
+                logger.warning(f"Failed to send alert for {signal.symbol}")
+            return success
+
+        except Exception as e:
+            logger.error(f"Error sending signal for {signal.symbol}: {e}")
+            return False
 
     async def _send_message(self, text: str) -> bool:
         """Send text message to Telegram.
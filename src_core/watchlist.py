@@ -15,7 +15,11 @@ class WatchlistManager:
             watchlist_file: Path to watchlist file.
         """
         self._file_path = Path(watchlist_file)
-        self._coins: set[str] = set()
+        self._coins: frozenset[str] = frozenset()
+        # Coins plus their MEXC futures symbols, for O(1) lookups per ticker
+        self._symbols: frozenset[str] = frozenset()
+        # Modification time of the file when last loaded
+        self._mtime: float | None = None
         
     def load(self) -> None:
         """Load coins from watchlist file."""
@@ -26,25 +30,34 @@ class WatchlistManager:
             return
             
         try:
+            self._mtime = self._file_path.stat().st_mtime
             content = self._file_path.read_text(encoding="utf-8")
             lines = content.strip().split("\n")
             
-            # Filter out comments and empty lines
+            # Filter out comments and empty lines (strip each line once)
             coins = [
-                line.strip().upper()
-                for line in lines
-                if line.strip() and not line.strip().startswith("#")
+                line.upper()
+                for line in map(str.strip, lines)
+                if line and not line.startswith("#")
             ]
             
-            self._coins = set(coins)
+            self._coins = frozenset(coins)
+            self._symbols = self._coins.union(f"{coin}_USDT" for coin in self._coins)
             logger.info(f"Loaded {len(self._coins)} coins from watchlist: {', '.join(sorted(self._coins))}")
             
         except Exception as e:
             logger.error(f"Error loading watchlist: {e}")
-            self._coins = set()
+            self._coins = frozenset()
+            self._symbols = frozenset()
     
     def reload(self) -> None:
-        """Reload watchlist from file."""
+        """Reload watchlist from file if it changed since the last load."""
+        try:
+            if self._file_path.stat().st_mtime == self._mtime:
+                return
+        except OSError:
+            pass
+
         old_count = len(self._coins)
         self.load()
         new_count = len(self._coins)
@@ -61,14 +74,13 @@ class WatchlistManager:
         Returns:
             True if symbol is watched.
         """
-        # Handle both formats: BTC_USDT and BTC
-        coin = symbol.replace("_USDT", "").upper()
-        return coin in self._coins
+        # Both formats (BTC_USDT and BTC) are precomputed on load
+        return symbol in self._symbols
     
     @property
-    def coins(self) -> set[str]:
-        """Get all watched coins."""
-        return self._coins.copy()
+    def coins(self) -> frozenset[str]:
+        """Get all watched coins (immutable, so no defensive copy is needed)."""
+        return self._coins
     
     @property
     def count(self) -> int: